@@ -0,0 +1,347 @@
+import os
+import sys
+import math
+import time
+import random
+import argparse
+import tempfile
+import importlib.util
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+def load_game_module():
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Jogo PBL.py")
+    spec = importlib.util.spec_from_file_location("jogo_pbl", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["jogo_pbl"] = module
+    spec.loader.exec_module(module)
+
+    return module
+
+jogo = load_game_module()
+
+from emg_features import EmgFeatures, StreamingEmgFeatures
+
+def legacy_rasterize_line(start, end):
+
+    pixels = []
+    x1, y1 = start
+    x2, y2 = end
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx - dy
+
+    while True:
+
+        pixels.append((x1, y1))
+
+        if x1 == x2 and y1 == y2:
+
+            break
+
+        e2 = err * 2
+
+        if e2 > -dy:
+
+            err -= dy
+            x1 += sx
+
+        if e2 < dx:
+
+            err += dx
+            y1 += sy
+
+    return pixels
+
+def legacy_rasterize_polyline(points):
+
+    pixels = []
+
+    for i in range(len(points) - 1):
+
+        pixels.extend(legacy_rasterize_line(points[i], points[i + 1]))
+
+    return pixels
+
+def legacy_accuracy(phase, tolerance = 5):
+
+    user_pixels = legacy_rasterize_polyline(phase.user_line)
+    target_pixels = legacy_rasterize_polyline(phase.current_checkpoints)
+
+    user_pixels_set = set(user_pixels)
+    target_pixels_set = set(target_pixels)
+    intersection = set()
+
+    for user_pixel in user_pixels_set:
+
+        for target_pixel in target_pixels_set:
+
+            if abs(user_pixel[0] - target_pixel[0]) <= tolerance and abs(user_pixel[1] - target_pixel[1]) <= tolerance:
+
+                intersection.add(user_pixel)
+
+                break
+
+    if len(target_pixels_set) == 0 or len(user_pixels_set) == 0:
+
+        return 0
+
+    return (len(intersection) / len(user_pixels_set)) * 100
+
+def generate_trace(checkpoints, points_per_segment, noise, rng):
+
+    trace = []
+
+    for (x1, y1), (x2, y2) in zip(checkpoints, checkpoints[1:]):
+
+        for step in range(points_per_segment):
+
+            t = step / points_per_segment
+            trace.append((int(x1 + (x2 - x1) * t + rng.gauss(0, noise)),
+                          int(y1 + (y2 - y1) * t + rng.gauss(0, noise))))
+
+    trace.append(tuple(checkpoints[-1]))
+
+    return trace
+
+def timed(function, *args, repeat = 1):
+
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+
+        result = function(*args)
+
+    return result, (time.perf_counter() - start) / repeat
+
+def benchmark_accuracy(seed = 0):
+
+    rng = random.Random(seed)
+    random.seed(seed)
+
+    print("Precisão da fase 2 (calculate_accuracy)")
+
+    for points_per_segment in (25, 100, 400):
+
+        for noise in (2, 8):
+
+            phase = jogo.PhaseTwo()
+            phase.current_checkpoints = phase.checkpoints.copy()
+            phase.user_line = generate_trace(phase.checkpoints, points_per_segment, noise, rng)
+
+            legacy, legacy_time = timed(legacy_accuracy, phase)
+            phase.accuracy_engine = None
+            current, current_time = timed(phase.calculate_accuracy)
+
+            if legacy != current:
+
+                raise AssertionError(f"Resultado divergente: {legacy} != {current}")
+
+            print(f"  {len(phase.user_line):5d} pontos, ruído {noise}: antigo {legacy_time:.4f} s, "
+                  f"novo {current_time:.4f} s ({legacy_time / current_time:.0f}x), precisão {current:.2f}%")
+
+def benchmark_rasterize(seed = 0):
+
+    rng = random.Random(seed)
+
+    print("Rasterização de polilinhas (Utils.rasterize_polyline)")
+
+    for length in (100, 1000, 10000):
+
+        points = [(rng.randint(0, jogo.Config.SCREEN_WIDTH), rng.randint(0, jogo.Config.SCREEN_HEIGHT)) for _ in range(length)]
+
+        legacy, legacy_time = timed(legacy_rasterize_polyline, points)
+        current, current_time = timed(jogo.Utils.rasterize_polyline, points)
+
+        if [tuple(pixel) for pixel in current.tolist()] != legacy:
+
+            raise AssertionError("Conjunto de pixels divergente")
+
+        print(f"  {length:5d} pontos, {len(legacy):8d} pixels: antigo {legacy_time:.4f} s, "
+              f"novo {current_time:.4f} s ({legacy_time / current_time:.0f}x)")
+
+def legacy_checkpoint_scan(checkpoints, stroke):
+
+    status = [False] * len(checkpoints)
+
+    for point in stroke:
+
+        for i, cp in enumerate(checkpoints):
+
+            if i == 0 or status[i - 1]:
+
+                if not status[i] and math.hypot(cp[0] - point[0], cp[1] - point[1]) <= 10:
+
+                    status[i] = True
+
+    return status
+
+def batched_checkpoint_scan(checkpoints, stroke, batch_size):
+
+    phase = jogo.PhaseTwo()
+    phase.checkpoints = checkpoints
+    phase.checkpoint_status = [False] * len(checkpoints)
+    points = jogo.np.asarray(stroke, dtype = float)
+
+    for i in range(0, len(points) - 1, batch_size):
+
+        phase.update_checkpoints(points[i:i + batch_size + 1])
+
+    return phase.checkpoint_status
+
+def benchmark_checkpoints(seed = 0):
+
+    rng = random.Random(seed)
+
+    print("Detecção de checkpoints (PhaseTwo.update_checkpoints)")
+
+    for count in (5, 100, 400):
+
+        checkpoints = [(rng.randint(100, jogo.Config.SCREEN_WIDTH - 100),
+                        rng.randint(100, jogo.Config.SCREEN_HEIGHT - 100)) for _ in range(count)]
+        stroke = generate_trace(checkpoints, 20, 1, rng)
+
+        legacy, legacy_time = timed(legacy_checkpoint_scan, checkpoints, stroke)
+        current, current_time = timed(batched_checkpoint_scan, checkpoints, stroke, 8)
+
+        print(f"  {count:3d} checkpoints, {len(stroke):5d} eventos: antigo {legacy_time:.4f} s "
+              f"({legacy.count(True)} atingidos), novo {current_time:.4f} s ({current.count(True)} atingidos)")
+
+def benchmark_simulation(seed = 0, sessions = 20):
+
+    print("Sessões simuladas (Simulation, modo headless)")
+
+    with tempfile.TemporaryDirectory() as folder:
+
+        results = jogo.Simulation(sessions, seed, folder).run()
+
+    frames = sum(result["frames"] for result in results)
+    seconds = sum(result["seconds"] for result in results)
+
+    print(f"  {frames} quadros, {seconds / frames * 1000:.3f} ms por quadro em média")
+
+def benchmark_ingest(seed = 0, duration = 2.0):
+
+    if jogo.pty is None:
+
+        print("Ingestão serial: requer pseudo-terminais (Linux ou macOS)")
+
+        return
+
+    print("Ingestão serial (DataCollector + VirtualSerialSource)")
+
+    with tempfile.TemporaryDirectory() as folder:
+
+        for protocol in ("csv", "binary"):
+
+            for rate in (1000, 5000, 20000, 50000, 100000):
+
+                source = jogo.VirtualSerialSource(rate, seed, protocol = protocol)
+                collector = jogo.DataCollector(output_folder = folder, sample_rate = rate, source = source, protocol = protocol)
+
+                collector.start_collection()
+                time.sleep(duration)
+                collector.stop_collection()
+
+                received = len(collector.buffer)
+                dropped = source.dropped_samples
+
+                print(f"  {protocol:6s} {rate:6d} amostras/s: recebidas {received / duration:9.0f}/s, "
+                      f"descartadas {dropped} ({dropped / max(source.sent_samples, 1) * 100:.2f}%)")
+
+def benchmark_decode(seed = 0, count = 200000):
+
+    print("Decodificação de amostras (LineParser x FrameDecoder)")
+
+    values = jogo.SyntheticSignal(seed = seed).generate(count)
+
+    for name, parser, data in (("csv", jogo.LineParser(), jogo.SyntheticSignal.encode(values, "csv")),
+                               ("binary", jogo.FrameDecoder(), jogo.SyntheticSignal.encode(values, "binary"))):
+
+        decoded, elapsed = timed(parser.feed, data)
+
+        print(f"  {name:6s}: {len(data) / count:5.1f} bytes por amostra, {len(decoded) / elapsed:12.0f} amostras/s")
+
+def benchmark_storage(seed = 0, count = 1000000):
+
+    print("Armazenamento de sessão (CSV x SessionFormat)")
+
+    columns = jogo.DataCollector.SENSOR_COLUMNS
+    values = jogo.SyntheticSignal(seed = seed).generate(count)
+    records = jogo.np.empty(count, dtype = jogo.SessionFormat.dtype(columns))
+    records[columns[0]["name"]] = jogo.np.arange(count)
+
+    for i, column in enumerate(columns[1:]):
+
+        records[column["name"]] = values[:, i]
+
+    with tempfile.TemporaryDirectory() as folder:
+
+        path = os.path.join(folder, "sensor_data" + jogo.SessionFormat.EXTENSION)
+
+        _, write_time = timed(jogo.SessionFormat.write, path, columns, records, {"sample_rate": 1000})
+        csv_path, csv_time = timed(jogo.SessionFormat.to_csv, path)
+        data, read_time = timed(jogo.SessionFormat.read, path)
+        _, parse_time = timed(jogo.SessionFormat.read_csv, csv_path)
+        _, scan_time = timed(lambda: data.column(1).mean(dtype = jogo.np.float64))
+
+        print(f"  {count} amostras: binário {os.path.getsize(path) / 1e6:.1f} MB, CSV {os.path.getsize(csv_path) / 1e6:.1f} MB")
+        print(f"  escrita: binário {write_time:.3f} s, CSV {csv_time:.3f} s")
+        print(f"  leitura: binário {read_time:.4f} s (+{scan_time:.4f} s para percorrer uma coluna), CSV {parse_time:.3f} s")
+
+def benchmark_emg_features(seed = 0, seconds = 600, rate = 1000):
+
+    print("Características do EMG (EmgFeatures, janelas de 250 ms a cada 125 ms)")
+
+    values = jogo.SyntheticSignal(seed = seed).generate(seconds * rate)[:, 0]
+    features = EmgFeatures(rate)
+
+    records, batch_time = timed(features.compute, values)
+
+    def streaming():
+
+        stream = StreamingEmgFeatures(rate)
+
+        return sum(len(stream.update(values[i:i + 256])) for i in range(0, len(values), 256))
+
+    count, stream_time = timed(streaming)
+
+    with tempfile.TemporaryDirectory() as folder:
+
+        path = os.path.join(folder, "sensor_data" + jogo.SessionFormat.EXTENSION)
+        jogo.SessionFormat.write(path, [{"name": "EMG", "format": "<f4"}], values.astype("<f4").view([("EMG", "<f4")]))
+        features.cached(path, None, values)
+        _, cached_time = timed(features.cached, path, None, values)
+
+    print(f"  {len(values)} amostras, {len(records)} janelas: vetorizado {batch_time:.3f} s, "
+          f"streaming {stream_time:.3f} s ({count} janelas), cache {cached_time * 1000:.2f} ms")
+
+BENCHMARKS = {"accuracy": benchmark_accuracy,
+              "rasterize": benchmark_rasterize,
+              "checkpoints": benchmark_checkpoints,
+              "simulation": benchmark_simulation,
+              "ingest": benchmark_ingest,
+              "decode": benchmark_decode,
+              "storage": benchmark_storage,
+              "emg": benchmark_emg_features}
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = "Benchmarks do RehabQuest")
+    parser.add_argument("benchmarks", nargs = "*", help = f"opções: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--seed", type = int, default = 0)
+    args = parser.parse_args()
+
+    for name in args.benchmarks:
+
+        if name not in BENCHMARKS:
+
+            parser.error(f"benchmark desconhecido: {name}")
+
+    for name in args.benchmarks or BENCHMARKS:
+
+        BENCHMARKS[name](seed = args.seed)
@@ -1,21 +1,706 @@
+import os
+import math
+import time
+import bisect
+import pickle
+import threading
+import numpy as np
+from collections import OrderedDict
 import pandas as pd
 import tkinter as tk
-from PIL import ImageGrab
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from tkinter import ttk, filedialog, messagebox
+from session_format import SessionFormat, SessionData
+from session_catalog import SessionCatalog
+from emg_features import EmgFeatures
+
+class MinMaxPyramid:
+
+    BASE = 64
+
+    def __init__(self, times, values, base = BASE):
+
+        self.times = times
+        self.values = values
+        self.base = base
+        self.parts = []
+        self.levels = []
+
+    def add_chunk(self, chunk):
+
+        edges = np.arange(0, len(chunk), self.base)
+        self.parts.append((np.minimum.reduceat(chunk, edges), np.maximum.reduceat(chunk, edges)))
+
+        return self.parts[-1]
+
+    def finish(self):
+
+        mins = np.concatenate([part[0] for part in self.parts]) if self.parts else np.empty(0)
+        maxs = np.concatenate([part[1] for part in self.parts]) if self.parts else np.empty(0)
+        self.parts = []
+        self.levels = [(mins, maxs)]
+
+        while len(mins) > 1:
+
+            if len(mins) % 2:
+
+                mins, maxs = np.append(mins, mins[-1]), np.append(maxs, maxs[-1])
+
+            mins = np.minimum(mins[0::2], mins[1::2])
+            maxs = np.maximum(maxs[0::2], maxs[1::2])
+            self.levels.append((mins, maxs))
+
+        return self
+
+    def index_range(self, start_time, end_time, margin = 1):
+
+        first = max(bisect.bisect_left(self.times, start_time) - margin, 0)
+        last = min(bisect.bisect_right(self.times, end_time) + margin, len(self.values))
+
+        return first, last
+
+    def extremes(self, first, last):
+
+        base = self.base
+        first_block, last_block = -(-first // base), last // base
+
+        if first_block >= last_block:
+
+            chunk = np.asarray(self.values[first:last], dtype = np.float64)
+
+            return chunk.min(), chunk.max()
+
+        edges = [np.asarray(self.values[first:first_block * base], dtype = np.float64),
+                 np.asarray(self.values[last_block * base:last], dtype = np.float64)]
+        low = min([edge.min() for edge in edges if len(edge)], default = np.inf)
+        high = max([edge.max() for edge in edges if len(edge)], default = -np.inf)
+        level = 0
+
+        while first_block < last_block:
+
+            mins, maxs = self.levels[level]
+
+            if first_block % 2:
+
+                low, high = min(low, mins[first_block]), max(high, maxs[first_block])
+                first_block += 1
+
+            if last_block % 2:
+
+                last_block -= 1
+                low, high = min(low, mins[last_block]), max(high, maxs[last_block])
+
+            first_block, last_block, level = first_block // 2, last_block // 2, level + 1
+
+        return float(low), float(high)
+
+    def query(self, start_time, end_time, points):
+
+        first, last = self.index_range(start_time, end_time)
+        span = last - first
+
+        if span <= 2 * points or not self.levels:
+
+            return np.asarray(self.times[first:last], dtype = np.float64), np.asarray(self.values[first:last], dtype = np.float64)
+
+        level = min(max(0, math.ceil(math.log2(span / (points * self.base)))), len(self.levels) - 1)
+        size = self.base << level
+        mins, maxs = self.levels[level]
+        first_bucket, last_bucket = first // size, -(-last // size)
+        times = np.asarray(self.times[first_bucket * size:last_bucket * size:size], dtype = np.float64)
+        values = np.column_stack((mins[first_bucket:last_bucket], maxs[first_bucket:last_bucket])).ravel()
+
+        return np.repeat(times, 2), values
+
+class ChannelKpi:
+
+    def __init__(self, values, pyramid):
+
+        self.values = values
+        self.pyramid = pyramid
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.offset = None
+        self.block_sums = []
+        self.block_squares = []
+        self.prefix_sum = None
+        self.prefix_square = None
+        self.cached = None
+
+    def update(self, chunk):
+
+        if not len(chunk):
+
+            return
+
+        if self.offset is None:
+
+            self.offset = float(chunk[0])
+
+        chunk_mean = chunk.mean()
+        total = self.count + len(chunk)
+        delta = chunk_mean - self.mean
+        self.m2 += np.square(chunk - chunk_mean).sum() + delta * delta * self.count * len(chunk) / total
+        self.mean += delta * len(chunk) / total
+        self.count = total
+        self.cached = None
+
+        shifted = chunk - self.offset
+        edges = np.arange(0, len(chunk), self.pyramid.base)
+        self.block_sums.append(np.add.reduceat(shifted, edges))
+        self.block_squares.append(np.add.reduceat(shifted * shifted, edges))
+
+    def finish(self):
+
+        self.prefix_sum = np.concatenate(([0.0], np.cumsum(np.concatenate(self.block_sums)))) if self.block_sums else np.zeros(1)
+        self.prefix_square = np.concatenate(([0.0], np.cumsum(np.concatenate(self.block_squares)))) if self.block_squares else np.zeros(1)
+        self.block_sums, self.block_squares = [], []
+
+        return self
+
+    def stats(self):
+
+        if self.cached is None:
+
+            if not self.count:
+
+                return None
+
+            low, high = self.pyramid.extremes(0, self.count)
+            self.cached = {"max": high, "min": low, "mean": self.mean, "std": np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0}
+
+        return self.cached
+
+    def window(self, first, last):
+
+        count = last - first
+
+        if count <= 0:
+
+            return None
+
+        base = self.pyramid.base
+        first_block, last_block = -(-first // base), last // base
+
+        if first_block >= last_block:
+
+            edges = [np.asarray(self.values[first:last], dtype = np.float64) - self.offset]
+            total = square = 0.0
+
+        else:
+
+            edges = [np.asarray(self.values[first:first_block * base], dtype = np.float64) - self.offset,
+                     np.asarray(self.values[last_block * base:last], dtype = np.float64) - self.offset]
+            total = self.prefix_sum[last_block] - self.prefix_sum[first_block]
+            square = self.prefix_square[last_block] - self.prefix_square[first_block]
+
+        total += sum(edge.sum() for edge in edges)
+        square += sum(np.square(edge).sum() for edge in edges)
+        low, high = self.pyramid.extremes(first, last)
+        variance = max(square - total * total / count, 0.0) / (count - 1) if count > 1 else 0.0
+
+        return {"max": high, "min": low, "mean": self.offset + total / count, "std": np.sqrt(variance)}
+
+class KpiEngine:
+
+    def __init__(self, pyramids):
+
+        self.channels = {position: ChannelKpi(pyramid.values, pyramid) for position, pyramid in pyramids.items()}
+
+    def update(self, position, chunk):
+
+        self.channels[position].update(chunk)
+
+    def finish(self):
+
+        for channel in self.channels.values():
+
+            channel.finish()
+
+        return self
+
+    def stats(self, position):
+
+        return self.channels[position].stats()
+
+    def window(self, position, start_time, end_time):
+
+        channel = self.channels[position]
+        first, last = channel.pyramid.index_range(start_time, end_time, margin = 0)
+
+        return channel.window(first, last)
+
+class SensorLoader:
+
+    def __init__(self, path, chunk_size = 1 << 20, sort_columns = (0, 1)):
+
+        self.path = path
+        self.chunk_size = chunk_size
+        self.sort_columns = sort_columns
+        self.progress = 0.0
+        self.data = None
+        self.pyramids = None
+        self.kpis = None
+        self.features = None
+        self.sort_indexes = {}
+        self.error = None
+        self.scanned = False
+        self.done = False
+        self.thread = threading.Thread(target = self.run, daemon = True)
+
+    def start(self):
+
+        self.thread.start()
+
+        return self
+
+    def run(self):
+
+        try:
+
+            if self.path.lower().endswith(SessionFormat.EXTENSION):
+
+                self.data = SessionFormat.read(self.path)
+
+            else:
+
+                self.data = self.read_csv_chunks()
+
+            self.scan()
+            self.scanned = True
+            self.extract_features()
+            self.sort_data()
+
+        except Exception as e:
+
+            self.error = e
+
+        self.done = True
+
+    def read_csv_chunks(self):
+
+        size = max(os.path.getsize(self.path), 1)
+        chunks = []
+
+        with open(self.path, mode = "r", encoding = "ISO-8859-1") as file:
+
+            for chunk in pd.read_csv(file, chunksize = self.chunk_size):
+
+                chunks.append(chunk)
+                self.progress = 0.5 * file.tell() / size
+
+        frame = pd.concat(chunks, ignore_index = True) if chunks else pd.DataFrame()
+        columns = [{"name": name, "format": "<f8" if i == 0 else "<f4"} for i, name in enumerate(frame.columns)]
+        records = np.empty(len(frame), dtype = SessionFormat.dtype(columns))
+
+        for name in frame.columns:
+
+            records[name] = frame[name].to_numpy()
+
+        return SessionData({"version": 1, "columns": columns, "attrs": {}}, records)
+
+    def scan(self):
+
+        data = self.data
+        count = len(data)
+        start_progress = self.progress
+        self.pyramids = {position: MinMaxPyramid(data.column(0), data.column(position)) for position in range(1, len(data.columns))}
+        self.kpis = KpiEngine(self.pyramids)
+        step = max(self.chunk_size // MinMaxPyramid.BASE, 1) * MinMaxPyramid.BASE
+
+        for start in range(0, count, step):
+
+            end = min(start + step, count)
+
+            for position, pyramid in self.pyramids.items():
+
+                chunk = np.asarray(data.column(position)[start:end], dtype = np.float64)
+                pyramid.add_chunk(chunk)
+                self.kpis.update(position, chunk)
+
+            self.progress = start_progress + (0.9 - start_progress) * end / count
+
+        for pyramid in self.pyramids.values():
+
+            pyramid.finish()
+
+        self.kpis.finish()
+
+    def extract_features(self):
+
+        data = self.data
+        times = data.column(0)
+
+        if len(data.columns) > 1 and len(data) > 1 and times[-1] > times[0]:
+
+            fs = data.attrs.get("sample_rate") or (len(data) - 1) / float(times[-1] - times[0])
+            self.features = EmgFeatures(fs).cached(self.path, times, data.column(1))
+
+        self.progress = 0.95
+
+    def sort_data(self):
+
+        for column in self.sort_columns:
+
+            if column >= len(self.data.columns):
+
+                continue
+
+            values = np.asarray(self.data.column(column))
+
+            if np.all(values[1:] >= values[:-1]):
+
+                self.sort_indexes[column] = np.arange(len(values))
+
+            else:
+
+                self.sort_indexes[column] = np.argsort(values, kind = "stable")
+
+        self.progress = 1.0
+
+class ReportWriter:
+
+    PAGE_SIZE = (11.69, 8.27)
+    TABLE_ROWS = 30
+
+    def __init__(self, path, figures, kpis, statistics = None, title = "Relatório da Sessão"):
+
+        self.path = path
+        self.figures = figures
+        self.kpis = kpis
+        self.statistics = statistics
+        self.title = title
+        self.progress = 0.0
+        self.error = None
+        self.done = False
+        self.thread = threading.Thread(target = self.run, daemon = True)
+
+    def start(self):
+
+        self.thread.start()
+
+        return self
+
+    def run(self):
+
+        try:
+
+            self.write()
+
+        except Exception as e:
+
+            self.error = e
+
+        self.done = True
+
+    def table_page(self, title, columns, rows, subtitle = None):
+
+        figure = Figure(figsize = self.PAGE_SIZE)
+        figure.suptitle(title, fontsize = 16, fontweight = "bold")
+
+        if subtitle:
+
+            figure.text(0.5, 0.9, subtitle, ha = "center", fontsize = 10)
+
+        ax = figure.add_axes([0.05, 0.05, 0.9, 0.8])
+        ax.axis("off")
+
+        if rows:
+
+            table = ax.table(cellText = rows, colLabels = columns, loc = "upper center", cellLoc = "center")
+            table.auto_set_font_size(False)
+            table.set_fontsize(9)
+            table.scale(1, 1.3)
+
+        else:
+
+            ax.text(0.5, 0.5, "Sem dados", ha = "center", va = "center")
+
+        return figure
+
+    def pages(self):
+
+        rows = [[name] + (["N/A"] * 4 if stats is None else [f"{stats[key]:.2f}" for key in ("max", "min", "mean", "std")])
+                for name, stats in self.kpis.items()]
+
+        yield self.table_page(self.title, ["Canal", "Máx.", "Min.", "Média", "Desvio Padrão"], rows,
+                              time.strftime("Gerado em %d/%m/%Y %H:%M"))
+
+        for figure in self.figures:
+
+            figure.set_size_inches(*self.PAGE_SIZE)
+            figure.tight_layout()
+
+            yield figure
+
+        if self.statistics is not None:
+
+            columns = [str(name) for name in self.statistics.columns]
+            values = list(zip(*[self.statistics[name].tolist() for name in self.statistics.columns]))
+            total = max(-(-len(values) // self.TABLE_ROWS), 1)
+
+            for page, start in enumerate(range(0, max(len(values), 1), self.TABLE_ROWS)):
+
+                rows = [[f"{value:.4f}" if isinstance(value, float) else str(value) for value in row]
+                        for row in values[start:start + self.TABLE_ROWS]]
+
+                yield self.table_page("Estatísticas do Jogo", columns, rows, f"Página {page + 1} de {total}")
+
+    def write(self):
+
+        count = 1 + len(self.figures) + (0 if self.statistics is None else max(-(-len(self.statistics) // self.TABLE_ROWS), 1))
+        partial = self.path + ".partial"
+
+        with PdfPages(partial, metadata = {"Title": self.title, "Creator": "RehabQuest"}) as pdf:
+
+            for i, figure in enumerate(self.pages()):
+
+                pdf.savefig(figure)
+                self.progress = (i + 1) / count
+
+        os.replace(partial, self.path)
+
+class TableModel:
+
+    def __init__(self, names, columns, sort_indexes = None):
+
+        self.names = list(names)
+        self.columns = list(columns)
+        self.count = len(self.columns[0]) if self.columns else 0
+        self.sort_indexes = {} if sort_indexes is None else sort_indexes
+        self.sort_column = None
+        self.descending = False
+        self.selection = None
+        self.rows = np.arange(self.count)
+
+    def __len__(self):
+
+        return len(self.rows)
+
+    def sort_index(self, column):
+
+        if column not in self.sort_indexes:
+
+            self.sort_indexes[column] = np.argsort(np.asarray(self.columns[column]), kind = "stable")
+
+        return self.sort_indexes[column]
+
+    def sort(self, column):
+
+        self.descending = not self.descending if column == self.sort_column else False
+        self.sort_column = column
+        self.refresh()
+
+    def filter(self, column, low = None, high = None):
+
+        if low is None and high is None:
+
+            self.selection = None
+
+        else:
+
+            order = self.sort_index(column)
+            values = np.asarray(self.columns[column])[order]
+            first = 0 if low is None else int(np.searchsorted(values, low, side = "left"))
+            last = len(values) if high is None else int(np.searchsorted(values, high, side = "right"))
+            self.selection = np.zeros(self.count, dtype = bool)
+            self.selection[order[first:last]] = True
+
+        self.refresh()
+
+    def refresh(self):
+
+        rows = np.arange(self.count) if self.sort_column is None else self.sort_index(self.sort_column)
+
+        if self.descending:
+
+            rows = rows[::-1]
+
+        self.rows = rows if self.selection is None else rows[self.selection[rows]]
+
+    def page(self, start, size):
+
+        rows = self.rows[start:start + size]
+        values = [np.asarray(column[rows]).tolist() for column in self.columns]
+
+        return [[f"{value:.4f}" if isinstance(value, float) else value for value in row] for row in zip(*values)]
+
+class VirtualTable:
+
+    def __init__(self, master, model, row_height = 20, status = None):
+
+        self.model = model
+        self.row_height = row_height
+        self.status = status
+        self.offset = 0
+        self.visible_rows = 20
+        self.worker = None
+
+        self.frame = tk.Frame(master)
+        self.frame.pack(fill = tk.BOTH, expand = True)
+
+        self.tree = ttk.Treeview(self.frame, columns = model.names, show = "headings", height = self.visible_rows)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient = tk.VERTICAL, command = self.on_scrollbar)
+        self.scrollbar.pack(side = tk.RIGHT, fill = tk.Y)
+        self.tree.pack(side = tk.LEFT, fill = tk.BOTH, expand = True)
+
+        for i, name in enumerate(model.names):
+
+            self.tree.heading(name, text = name, command = lambda column = i: self.sort(column))
+            self.tree.column(name, width = 100)
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll(-1 if event.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-1, "units"))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(1, "units"))
+
+        self.render()
+
+    def when_sorted(self, column, action):
+
+        if self.worker is not None:
+
+            return
+
+        if column in self.model.sort_indexes:
+
+            action()
+
+            return
+
+        self.worker = threading.Thread(target = self.model.sort_index, args = (column,), daemon = True)
+        self.worker.start()
+        self.tree.config(cursor = "watch")
+        self.render()
+        self.wait_sorted(action)
+
+    def wait_sorted(self, action):
+
+        if self.worker.is_alive():
+
+            self.tree.after(50, self.wait_sorted, action)
+
+            return
+
+        self.worker = None
+        self.tree.config(cursor = "")
+        action()
+
+    def sort(self, column):
+
+        self.when_sorted(column, lambda: self.apply_sort(column))
+
+    def apply_sort(self, column):
+
+        self.model.sort(column)
+
+        for i, name in enumerate(self.model.names):
+
+            arrow = (" ▼" if self.model.descending else " ▲") if i == column else ""
+            self.tree.heading(name, text = name + arrow)
+
+        self.offset = 0
+        self.render()
+
+    def filter(self, column, low, high):
+
+        if low is None and high is None:
+
+            self.apply_filter(column, low, high)
+
+        else:
+
+            self.when_sorted(column, lambda: self.apply_filter(column, low, high))
+
+    def apply_filter(self, column, low, high):
+
+        self.model.filter(column, low, high)
+        self.offset = 0
+        self.render()
+
+    def on_resize(self, event):
+
+        rows = max(1, (event.height - self.row_height) // self.row_height)
+
+        if rows != self.visible_rows:
+
+            self.visible_rows = rows
+            self.render()
+
+    def on_scrollbar(self, action, amount, unit = None):
+
+        if action == "moveto":
+
+            self.offset = int(float(amount) * len(self.model))
+            self.render()
+
+        else:
+
+            self.scroll(int(amount), unit)
+
+    def scroll(self, amount, unit):
+
+        self.offset += amount * (self.visible_rows if unit == "pages" else 1)
+        self.render()
+
+        return "break"
+
+    def render(self):
+
+        total = len(self.model)
+        self.offset = max(0, min(self.offset, total - self.visible_rows))
+        self.tree.delete(*self.tree.get_children())
+
+        for row in self.model.page(self.offset, self.visible_rows):
+
+            self.tree.insert("", tk.END, values = row)
+
+        if total:
+
+            self.scrollbar.set(self.offset / total, min(self.offset + self.visible_rows, total) / total)
+
+        else:
+
+            self.scrollbar.set(0, 1)
+
+        if self.status is not None and self.frame.winfo_manager():
+
+            self.status.set("Ordenando..." if self.worker is not None else f"{total} linhas")
 
 class Dashboard:
 
-    def __init__(self, root):
+    PHASES = {"Fase 1": "phase_one", "Fase 2": "phase_two"}
+    CHANNELS = {"EMG": 1, "FSR1": 2, "FSR2": 3}
+    CACHED_SESSIONS = 4
+    PROGRESS_GRAPHS = [("precision", "Precisão Média por Sessão", "%", "blue"),
+                       ("time", "Tempo Médio até o Acerto", "s", "#4CAF50"),
+                       ("emg_rms", "RMS do EMG por Sessão", "mV", "#FF6F61")]
+    FEATURE_GRAPHS = [(0, 2, "Amplitude do EMG por Janela", "mV", [("RMS", "RMS", "#FF6F61"), ("MAV", "MAV", "#33A1FD")]),
+                      (1, 2, "Frequência do EMG por Janela (Welch)", "Hz", [("Frequência Mediana (Hz)", "Mediana", "#4CAF50"),
+                                                                          ("Frequência Média (Hz)", "Média", "#FFD700")])]
+    SENSOR_GRAPHS = [(2, 0, 0, "Força no Antebraço ao Longo do Tempo", "N", "Força 1", None),
+                     (1, 0, 1, "Atividade EMG ao Longo do Tempo", "mV", "EMG", "#FF6F61"),
+                     (3, 1, 0, "Força no Dedo ao Longo do Tempo", "N", "Força 2", "#4CAF50")]
+
+    def __init__(self, root, results_folder = "Results"):
 
         self.root = root
+        self.results_folder = results_folder
+        self.catalog = None
         self.root.title("Dashboard de Sensores")
         self.root.attributes('-fullscreen', True)
         self.root.configure(bg = "#FFFFFF")
 
         self.game_statistics = None
         self.data_right = None
+        self.sensor_kpis = None
+        self.emg_features = None
+        self.loaded_sensors = OrderedDict()
+        self.sensor_pyramids = None
+        self.sensor_sort_indexes = {}
 
         tk.Label(root,
                  text = "DASHBOARD",
@@ -27,6 +712,22 @@ class Dashboard:
         self.button_frame = tk.Frame(root, bg = "#FFFFFF")
         self.button_frame.pack(pady = 10)
 
+        self.sessions_button = tk.Button(self.button_frame,
+                                         text = "Sessões",
+                                         command = self.show_sessions_window,
+                                         font = ("Arial", 12),
+                                         bg = "#D3D3D3",
+                                         fg = "black")
+        self.sessions_button.pack(side = tk.LEFT, padx = 10)
+
+        self.progress_button = tk.Button(self.button_frame,
+                                         text = "Evolução",
+                                         command = self.show_progress_window,
+                                         font = ("Arial", 12),
+                                         bg = "#D3D3D3",
+                                         fg = "black")
+        self.progress_button.pack(side = tk.LEFT, padx = 10)
+
         self.game_statistics_button = tk.Button(self.button_frame,
                                                 text = "Estatísticas do Jogo",
                                                 command = self.upload_game_statistics,
@@ -43,138 +744,440 @@ class Dashboard:
                                      fg = "black")
         self.load_button.pack(side = tk.LEFT, padx = 10)
 
-        self.save_button = tk.Button(self.button_frame,
-                                     text = "Salvar Dashboard",
-                                     command = self.save_dashboard_as_pdf,
-                                     font = ("Arial", 12),
-                                     bg = "#D3D3D3",
-                                     fg = "black")
-        self.save_button.pack(side = tk.LEFT, padx = 10)
-        self.save_button.config(state = tk.DISABLED)
+        self.save_button = tk.Button(self.button_frame,
+                                     text = "Salvar Dashboard",
+                                     command = self.save_dashboard_as_pdf,
+                                     font = ("Arial", 12),
+                                     bg = "#D3D3D3",
+                                     fg = "black")
+        self.save_button.pack(side = tk.LEFT, padx = 10)
+        self.save_button.config(state = tk.DISABLED)
+
+        self.table_button = tk.Button(self.button_frame,
+                                      text = "Ver Tabela",
+                                      command = self.show_table_window,
+                                      font = ("Arial", 12),
+                                      bg = "#D3D3D3",
+                                      fg = "black")
+        self.table_button.pack(side = tk.LEFT, padx = 10)
+
+        self.progress = ttk.Progressbar(self.button_frame, length = 200, maximum = 1.0)
+        self.loader = None
+
+        self.kpi_frame = tk.Frame(root, bg = "#FFFFFF")
+        self.kpi_frame.pack(fill = tk.X, padx = 10, pady = 5)
+
+        self.data_selection = tk.StringVar(value = "EMG")
+        self.data_selection_menu = ttk.Combobox(root,
+                                                textvariable = self.data_selection,
+                                                values = list(self.CHANNELS),
+                                                state = "readonly",
+                                                width = 10)
+        self.data_selection_menu.pack(pady = 5)
+        self.data_selection_menu.bind("<<ComboboxSelected>>", self.update_kpis)
+
+        self.window_kpis = tk.BooleanVar(value = False)
+        tk.Checkbutton(root,
+                       text = "KPIs do trecho visível",
+                       variable = self.window_kpis,
+                       command = self.update_kpis,
+                       bg = "#FFFFFF").pack()
+
+        self.create_kpi("Máx.", "N/A", "#33A1FD")
+        self.create_kpi("Min.", "N/A", "#FF6F61")
+        self.create_kpi("Média", "N/A", "#4CAF50")
+        self.create_kpi("Desvio Padrão", "N/A", "#FFD700")
+
+        self.emg_kpi_frame = tk.Frame(root, bg = "#FFFFFF")
+        self.emg_kpi_frame.pack(fill = tk.X, padx = 10, pady = 5)
+
+        self.create_kpi("RMS do EMG", "N/A", "#33A1FD", self.emg_kpi_frame)
+        self.create_kpi("MAV do EMG", "N/A", "#FF6F61", self.emg_kpi_frame)
+        self.create_kpi("Freq. Mediana (Hz)", "N/A", "#4CAF50", self.emg_kpi_frame)
+        self.create_kpi("Variação da Freq. Mediana (Hz/min)", "N/A", "#FFD700", self.emg_kpi_frame)
+
+        self.graph_frame = tk.Frame(root, bg = "#FFFFFF")
+        self.graph_frame.pack(fill = tk.BOTH,
+                              expand = True,
+                              padx = 10,
+                              pady = 5)
+
+        self.build_graphs()
+
+        self.exit_button = tk.Button(root,
+                                     text = "Sair",
+                                     command = self.exit_application,
+                                     font = ("Arial", 12),
+                                     bg = "#FF5733",
+                                     fg = "white")
+        self.exit_button.pack(side = tk.BOTTOM, pady = 10)
+
+    def create_kpi(self, title, value, color, frame = None):
+
+        kpi = tk.Frame(frame or self.kpi_frame,
+                       bg = color,
+                       width = 280,
+                       height = 80)
+        kpi.pack(side = tk.LEFT,
+                 padx = 5,
+                 pady = 5,
+                 fill = tk.BOTH,
+                 expand = True)
+
+        tk.Label(kpi,
+                 text = title,
+                 font = ("Arial", 14, "bold"),
+                 bg = color,
+                 fg = "#FFF").pack(pady = (5, 2))
+
+        self.kpi_label = tk.Label(kpi,
+                                  tex = value,
+                                  font = ("Arial", 18, "bold"),
+                                  bg = "#D3D3D3",
+                                  fg = "#333")
+        self.kpi_label.pack(fill = tk.BOTH, expand = True)
+
+    def ask_session_file(self):
+
+        return filedialog.askopenfilename(filetypes = [("Arquivos de Sessão", f"*{SessionFormat.EXTENSION} *.csv"),
+                                                       ("Arquivos CSV", "*.csv")])
+
+    def upload_game_statistics(self):
+
+        file_path = self.ask_session_file()
+
+        if not file_path:
+
+            return
+
+        try:
+
+            self.game_statistics = SessionFormat.load(file_path).to_dataframe()
+            self.update_statistics_graph()
+            
+        except Exception as e:
+
+            messagebox.showerror("Erro ao carregar arquivo", f"Ocorreu um erro ao processar o arquivo:\n{e}")
+
+    def load_right_csv(self):
+
+        file_path = self.ask_session_file()
+
+        if not file_path:
+
+            return
+
+        self.start_sensor_loader(file_path)
+
+    def loading(self):
+
+        if self.loader is not None:
+
+            messagebox.showinfo("Aviso", "Aguarde o fim do carregamento atual.")
+
+            return True
+
+        return False
+
+    def start_sensor_loader(self, file_path, statistics = None):
+
+        if self.loading():
+
+            return
+
+        try:
+
+            key = (os.path.abspath(file_path), os.path.getmtime(file_path))
+
+        except OSError as e:
+
+            messagebox.showerror("Erro ao carregar arquivo", f"Ocorreu um erro ao processar o arquivo:\n{e}")
+
+            return
+
+        if key in self.loaded_sensors:
+
+            if statistics is not None:
+
+                self.game_statistics = statistics
+
+            self.loaded_sensors.move_to_end(key)
+            self.show_sensors(*self.loaded_sensors[key])
+
+            return
+
+        self.loader = SensorLoader(file_path).start()
+        self.loader_key = key
+        self.loader_statistics = statistics
+        self.loader_published = False
+        self.load_button.config(state = tk.DISABLED)
+        self.sessions_button.config(state = tk.DISABLED)
+        self.progress["value"] = 0
+        self.progress.pack(side = tk.LEFT, padx = 10)
+
+        self.poll_sensor_loader()
+
+    def poll_sensor_loader(self):
+
+        loader = self.loader
+        self.progress["value"] = loader.progress
+
+        if loader.scanned and not self.loader_published:
+
+            self.loader_published = True
+
+            if self.loader_statistics is not None:
+
+                self.game_statistics = self.loader_statistics
+
+            self.show_sensors(loader.data, loader.pyramids, loader.kpis)
+
+        if not loader.done:
+
+            self.root.after(50, self.poll_sensor_loader)
+
+            return
+
+        self.loader = None
+        self.progress.pack_forget()
+        self.load_button.config(state = tk.NORMAL)
+        self.sessions_button.config(state = tk.NORMAL)
+
+        if loader.error is not None:
+
+            messagebox.showerror("Erro ao carregar arquivo", f"Ocorreu um erro ao processar o arquivo:\n{loader.error}")
+
+            return
+
+        self.loaded_sensors[self.loader_key] = (loader.data, loader.pyramids, loader.kpis, loader.features, loader.sort_indexes)
+
+        while len(self.loaded_sensors) > self.CACHED_SESSIONS:
+
+            self.loaded_sensors.popitem(last = False)
+
+        self.sensor_sort_indexes = loader.sort_indexes
+        self.show_features(loader.features)
+
+    def show_sensors(self, data, pyramids, kpis, features = None, sort_indexes = None):
+
+        try:
+
+            self.data_right = data
+            self.sensor_pyramids = pyramids
+            self.sensor_kpis = kpis
+            self.emg_features = features
+            self.sensor_sort_indexes = {} if sort_indexes is None else sort_indexes
+
+            self.update_kpis()
+            self.create_graphs()
+
+            self.save_button.config(state = tk.NORMAL)
+
+        except Exception as e:
+
+            messagebox.showerror("Erro ao carregar arquivo", f"Ocorreu um erro ao processar o arquivo:\n{e}")
+
+    def show_features(self, features):
+
+        self.emg_features = features
+        self.update_emg_kpis()
+        self.update_feature_graphs()
+
+    def show_sessions_window(self):
+
+        if self.catalog is None:
+
+            self.catalog = SessionCatalog(self.results_folder)
+
+        sessions_window = tk.Toplevel(self.root)
+        sessions_window.title("Sessões")
+        sessions_window.geometry("760x400")
+
+        filter_frame = tk.Frame(sessions_window)
+        filter_frame.pack(fill = tk.X, padx = 5, pady = 5)
+
+        patient = tk.StringVar(value = "Todos")
+        phase = tk.StringVar(value = "Fase 1")
+
+        patient_menu = ttk.Combobox(filter_frame,
+                                    textvariable = patient,
+                                    values = ["Todos"] + self.catalog.patients(),
+                                    state = "readonly",
+                                    width = 30)
+        patient_menu.pack(side = tk.LEFT, padx = 5)
+
+        phase_menu = ttk.Combobox(filter_frame,
+                                  textvariable = phase,
+                                  values = list(self.PHASES),
+                                  state = "readonly",
+                                  width = 10)
+        phase_menu.pack(side = tk.LEFT, padx = 5)
+
+        columns = ["Paciente", "Data", "Situação", "Duração (s)", "Arquivos"]
+        table = ttk.Treeview(sessions_window, columns = columns, show = "headings")
+        table.pack(fill = tk.BOTH, expand = True)
+
+        for col in columns:
+
+            table.heading(col, text = col)
+            table.column(col, width = 140)
+
+        def fill_table(event = None):
+
+            table.delete(*table.get_children())
+
+            for session in self.catalog.sessions(None if patient.get() == "Todos" else patient.get()):
+
+                table.insert("", tk.END, iid = session["id"], values = [session["patient"],
+                                                                        time.strftime("%d/%m/%Y %H:%M", time.localtime(session["started"])),
+                                                                        session["status"],
+                                                                        f"{session['duration']:.1f}",
+                                                                        session["files"]])
+
+        def open_selected(event = None):
+
+            if table.focus():
+
+                self.open_session(table.focus(), self.PHASES[phase.get()])
+
+        patient_menu.bind("<<ComboboxSelected>>", fill_table)
+        table.bind("<Double-1>", open_selected)
+
+        tk.Button(filter_frame,
+                  text = "Abrir",
+                  command = open_selected,
+                  font = ("Arial", 12),
+                  bg = "#D3D3D3",
+                  fg = "black").pack(side = tk.RIGHT, padx = 5)
+
+        fill_table()
+
+    def show_progress_window(self):
+
+        if self.catalog is None:
+
+            self.catalog = SessionCatalog(self.results_folder)
+
+        self.catalog.refresh()
+        patients = self.catalog.patients()
+
+        if not patients:
+
+            messagebox.showwarning("Aviso", "Nenhuma sessão registrada no catálogo.")
 
-        self.table_button = tk.Button(self.button_frame,
-                                      text = "Ver Tabela",
-                                      command = self.show_table_window,
-                                      font = ("Arial", 12),
-                                      bg = "#D3D3D3",
-                                      fg = "black")
-        self.table_button.pack(side = tk.LEFT, padx = 10)
+            return
 
-        self.kpi_frame = tk.Frame(root, bg = "#FFFFFF")
-        self.kpi_frame.pack(fill = tk.X, padx = 10, pady = 5)
+        progress_window = tk.Toplevel(self.root)
+        progress_window.title("Evolução do Paciente")
+        progress_window.geometry("900x700")
 
-        self.data_selection = tk.StringVar(value = "EMG")
-        self.data_selection_menu = ttk.Combobox(root,
-                                                textvariable = self.data_selection,
-                                                values = ["EMG", "FSR1", "FSR2"],
-                                                state = "readonly",
-                                                width = 10)
-        self.data_selection_menu.pack(pady = 5)
-        self.data_selection_menu.bind("<<ComboboxSelected>>", self.update_kpis)
+        filter_frame = tk.Frame(progress_window)
+        filter_frame.pack(fill = tk.X, padx = 5, pady = 5)
 
-        self.create_kpi("Máx.", "N/A", "#33A1FD")
-        self.create_kpi("Min.", "N/A", "#FF6F61")
-        self.create_kpi("Média", "N/A", "#4CAF50")
-        self.create_kpi("Desvio Padrão", "N/A", "#FFD700")
+        patient = tk.StringVar(value = patients[0])
+        phase = tk.StringVar(value = "Fase 1")
 
-        self.graph_frame = tk.Frame(root, bg = "#FFFFFF")
-        self.graph_frame.pack(fill = tk.BOTH,
-                              expand = True,
-                              padx = 10,
-                              pady = 5)
+        patient_menu = ttk.Combobox(filter_frame, textvariable = patient, values = patients, state = "readonly", width = 30)
+        patient_menu.pack(side = tk.LEFT, padx = 5)
 
-        self.figures = []
+        phase_menu = ttk.Combobox(filter_frame, textvariable = phase, values = list(self.PHASES), state = "readonly", width = 10)
+        phase_menu.pack(side = tk.LEFT, padx = 5)
 
-        self.exit_button = tk.Button(root,
-                                     text = "Sair",
-                                     command = self.exit_application,
-                                     font = ("Arial", 12),
-                                     bg = "#FF5733",
-                                     fg = "white")
-        self.exit_button.pack(side = tk.BOTTOM, pady = 10)
+        figure = Figure(figsize = (9, 6), dpi = 100)
+        trends = {}
 
-    def create_kpi(self, title, value, color):
+        for i, (key, title, unit, color) in enumerate(self.PROGRESS_GRAPHS):
 
-        kpi = tk.Frame(self.kpi_frame,
-                       bg = color,
-                       width = 280,
-                       height = 80)
-        kpi.pack(side = tk.LEFT,
-                 padx = 5,
-                 pady = 5,
-                 fill = tk.BOTH,
-                 expand = True)
+            ax = figure.add_subplot(len(self.PROGRESS_GRAPHS), 1, i + 1)
+            trends[key], = ax.plot([], [], marker = "o", color = color)
+            ax.set_title(title)
+            ax.set_ylabel(unit)
+            ax.grid(True, linestyle = "--", alpha = 0.7)
 
-        tk.Label(kpi,
-                 text = title,
-                 font = ("Arial", 14, "bold"),
-                 bg = color,
-                 fg = "#FFF").pack(pady = (5, 2))
+        ax.set_xlabel("Sessão")
+        figure.tight_layout()
 
-        self.kpi_label = tk.Label(kpi,
-                                  tex = value,
-                                  font = ("Arial", 18, "bold"),
-                                  bg = "#D3D3D3",
-                                  fg = "#333")
-        self.kpi_label.pack(fill = tk.BOTH, expand = True)
+        canvas = FigureCanvasTkAgg(figure, master = progress_window)
+        NavigationToolbar2Tk(canvas, progress_window).pack(side = tk.BOTTOM, fill = tk.X)
+        canvas.get_tk_widget().pack(fill = tk.BOTH, expand = True)
 
-    def upload_game_statistics(self):
+        def update_trends(event = None):
 
-        file_path = filedialog.askopenfilename(filetypes = [("Arquivos CSV", "*.csv")])
+            sessions = self.catalog.progress(patient.get(), self.PHASES[phase.get()])
+            labels = [time.strftime("%d/%m/%y", time.localtime(session["started"])) for session in sessions]
+            positions = np.arange(len(sessions))
 
-        if not file_path:
+            for key, line in trends.items():
 
-            return
+                line.set_data(positions, [np.nan if session[key] is None else session[key] for session in sessions])
+                line.axes.set_xticks(positions, labels if len(labels) <= 30 else [""] * len(labels))
+                line.axes.relim()
+                line.axes.autoscale_view()
 
-        try:
+            canvas.draw_idle()
 
-            self.game_statistics = pd.read_csv(file_path, encoding = "ISO-8859-1")
-            
-        except Exception as e:
+        patient_menu.bind("<<ComboboxSelected>>", update_trends)
+        phase_menu.bind("<<ComboboxSelected>>", update_trends)
 
-            messagebox.showerror("Erro ao carregar arquivo", f"Ocorreu um erro ao processar o arquivo:\n{e}")
+        update_trends()
 
-    def load_right_csv(self):
+    def open_session(self, session_id, phase):
 
-        file_path = filedialog.askopenfilename(filetypes = [("Arquivos CSV", "*.csv")])
+        if self.loading():
 
-        if not file_path:
+            return
+
+        statistics_name = phase + SessionFormat.EXTENSION
+        sensor_name = phase + "_sensor_data" + SessionFormat.EXTENSION
+        statistics_path = self.catalog.path(session_id, statistics_name)
+        sensor_path = self.catalog.path(session_id, sensor_name)
+
+        if not os.path.exists(statistics_path) or not os.path.exists(sensor_path):
+
+            messagebox.showwarning("Aviso", "Esta sessão não possui dados para a fase selecionada.")
 
             return
 
         try:
 
-            self.data_right = pd.read_csv(file_path, encoding = "ISO-8859-1")
+            statistics = SessionFormat.read(statistics_path).to_dataframe()
 
-            self.update_kpis()
-            self.create_graphs()
+        except Exception as e:
 
-            self.save_button.config(state = tk.NORMAL)
+            messagebox.showerror("Erro ao carregar sessão", f"Ocorreu um erro ao processar a sessão:\n{e}")
 
-        except Exception as e:
+            return
 
-            messagebox.showerror("Erro ao carregar arquivo", f"Ocorreu um erro ao processar o arquivo:\n{e}")
+        self.start_sensor_loader(sensor_path, statistics)
 
     def update_kpis(self, event = None):
 
-        selected_data = self.data_selection.get()
-        
-        if selected_data == "EMG":
+        if self.sensor_kpis is None:
+
+            return
+
+        self.update_emg_kpis()
 
-            data_column = self.data_right.iloc[:, 1]
+        position = self.CHANNELS[self.data_selection.get()]
 
-        elif selected_data == "FSR1":
+        if self.window_kpis.get():
 
-            data_column = self.data_right.iloc[:, 2]
+            start_time, end_time = self.sensor_lines[position].axes.get_xlim()
+            stats = self.sensor_kpis.window(position, start_time, end_time)
 
         else:
 
-            data_column = self.data_right.iloc[:, 3]
+            stats = self.sensor_kpis.stats(position)
+
+        if stats is None:
+
+            for widget in self.kpi_frame.winfo_children():
+
+                widget.winfo_children()[1].config(text = "N/A")
+
+            return
 
-        data_max = data_column.max()
-        data_min = data_column.min()
-        data_mean = data_column.mean()
-        data_std = data_column.std()
+        data_max, data_min, data_mean, data_std = stats["max"], stats["min"], stats["mean"], stats["std"]
 
         kpi_values = [f"{data_max:.2f}",
                       f"{data_min:.2f}",
@@ -185,85 +1188,257 @@ class Dashboard:
 
             widget.winfo_children()[1].config(text = value)
 
-    def create_graphs(self):
+    def update_emg_kpis(self):
 
-        for widget in self.graph_frame.winfo_children():
+        if self.emg_features is None:
 
-            widget.destroy()
+            summary = None
 
-        self.figures = []
+        elif self.window_kpis.get():
+
+            start_time, end_time = self.sensor_lines[self.CHANNELS["EMG"]].axes.get_xlim()
+            summary = EmgFeatures.summary(EmgFeatures.window(self.emg_features.records, start_time, end_time))
+
+        else:
+
+            summary = EmgFeatures.summary(self.emg_features.records)
+
+        if summary is None:
+
+            kpi_values = ["N/A"] * 4
+
+        else:
+
+            kpi_values = [f"{summary['rms']:.2f}",
+                          f"{summary['mav']:.2f}",
+                          f"{summary['median_frequency']:.1f}",
+                          f"{summary['median_frequency_slope']:+.2f}"]
+
+        for widget, value in zip(self.emg_kpi_frame.winfo_children(), kpi_values):
+
+            widget.winfo_children()[1].config(text = value)
+
+    def build_graphs(self):
 
         self.graph_frame.columnconfigure(0, weight = 1)
         self.graph_frame.columnconfigure(1, weight = 1)
+        self.graph_frame.columnconfigure(2, weight = 1)
         self.graph_frame.rowconfigure(0, weight = 2)
         self.graph_frame.rowconfigure(1, weight = 1)
 
-        fig1 = Figure(figsize = (5, 2.5), dpi = 100)
-        ax1 = fig1.add_subplot(111)
-        ax1.plot(self.data_right.iloc[:, 0], self.data_right.iloc[:, 2], label = "Força 1")
-        ax1.set_title("Força no Antebraço ao Longo do Tempo")
-        ax1.set_ylabel("N")
-        ax1.set_xlabel("Tempo")
-        ax1.legend(loc = 'lower right')
-        ax1.grid(True, linestyle = '--', alpha = 0.7)
-        fig1.tight_layout()
-        self.figures.append(fig1)
-
-        canvas1 = FigureCanvasTkAgg(fig1, master = self.graph_frame)
-        canvas1.get_tk_widget().grid(row = 0,
-                                     column = 0,
-                                     padx = 10,
-                                     pady = 10)
-
-        fig2 = Figure(figsize = (5, 2.5), dpi = 100)
-        ax2 = fig2.add_subplot(111)
-        ax2.plot(self.data_right.iloc[:, 0],
-                 self.data_right.iloc[:, 1],
-                 label = "EMG",
-                 color = "#FF6F61")
-        ax2.set_title("Atividade EMG ao Longo do Tempo")
-        ax2.set_ylabel("mV")
-        ax2.set_xlabel("Tempo")
-        ax2.legend(loc = 'lower right')
-        ax2.grid(True, linestyle = '--', alpha = 0.7)
-        fig2.tight_layout()
-        self.figures.append(fig2)
-
-        canvas2 = FigureCanvasTkAgg(fig2, master = self.graph_frame)
-        canvas2.get_tk_widget().grid(row = 0,
-                                     column = 1,
-                                     padx = 10,
-                                     pady = 10)
-
-        fig3 = Figure(figsize = (5, 2.5), dpi = 100)
-        ax3 = fig3.add_subplot(111)
-        ax3.plot(self.data_right.iloc[:, 0],
-                 self.data_right.iloc[:, 3],
-                 label = "Força 2",
-                 color = "#4CAF50")
-        ax3.set_title("Força no Dedo ao Longo do Tempo")
-        ax3.set_ylabel("N")
-        ax3.set_xlabel("Tempo")
-        ax3.legend(loc = 'lower right')
-        ax3.grid(True, linestyle = '--', alpha = 0.7)
-        fig3.tight_layout()
-        self.figures.append(fig3)
-
-        canvas3 = FigureCanvasTkAgg(fig3, master = self.graph_frame)
-        canvas3.get_tk_widget().grid(row = 1,
-                                     column = 0,
-                                     padx = 10,
-                                     pady = 10)
-
-        if self.game_statistics.shape[1] == 3:
-
-            tempos = self.game_statistics.iloc[:, 1]
+        self.figures = []
+        self.toolbars = []
+        self.sensor_lines = {}
+        self.shown_limits = {}
+
+        for position, row, column, title, unit, label, color in self.SENSOR_GRAPHS:
+
+            figure, self.sensor_lines[position] = self.sensor_figure(title, unit, label, color)
+            figure.axes[0].callbacks.connect("xlim_changed", lambda axes, position = position: self.refine_sensor_graph(position))
+            self.figures.append(figure)
+
+            self.place_figure(figure, row = row, column = column, toolbar = True)
+
+        figure, self.precision_axes = self.precision_figure()
+        self.precision_bars = None
+        self.figures.append(figure)
+
+        self.place_figure(figure, row = 1, column = 1)
+
+        self.feature_lines = {}
+
+        for row, column, title, unit, series in self.FEATURE_GRAPHS:
+
+            figure, lines = self.feature_figure(title, unit, series)
+            self.feature_lines.update(lines)
+            self.figures.append(figure)
+
+            self.place_figure(figure, row = row, column = column)
+
+    @staticmethod
+    def sensor_figure(title, unit, label, color):
+
+        figure = Figure(figsize = (5, 2.5), dpi = 100)
+        ax = figure.add_subplot(111)
+        line, = ax.plot([], [], label = label, color = color)
+        ax.set_title(title)
+        ax.set_ylabel(unit)
+        ax.set_xlabel("Tempo")
+        ax.legend(loc = 'lower right')
+        ax.grid(True, linestyle = '--', alpha = 0.7)
+        figure.tight_layout()
+
+        return figure, line
+
+    @staticmethod
+    def feature_figure(title, unit, series):
+
+        figure = Figure(figsize = (5, 2.5), dpi = 100)
+        ax = figure.add_subplot(111)
+        lines = {}
+
+        for name, label, color in series:
+
+            lines[name], = ax.plot([], [], label = label, color = color)
+
+        ax.set_title(title)
+        ax.set_ylabel(unit)
+        ax.set_xlabel("Tempo")
+        ax.legend(loc = 'lower right')
+        ax.grid(True, linestyle = '--', alpha = 0.7)
+        figure.tight_layout()
+
+        return figure, lines
+
+    @staticmethod
+    def plot_features(lines, features):
+
+        times = features.records[EmgFeatures.COLUMNS[0]["name"]]
+        axes = set()
+
+        for name, line in lines.items():
+
+            line.set_data(times, features.records[name])
+            axes.add(line.axes)
+
+        for ax in axes:
+
+            ax.relim()
+            ax.autoscale_view()
+
+        return axes
+
+    @staticmethod
+    def precision_figure():
+
+        figure = Figure(figsize = (5, 2.5), dpi = 100)
+        ax = figure.add_subplot(111)
+        ax.set_title("Precisão Média por Intervalo de Tempo")
+        ax.set_xlabel("Intervalos de Tempo (s)")
+        ax.set_ylabel("Precisão Média")
+        ax.grid(True, linestyle = "--", alpha = 0.7)
+        figure.tight_layout()
+
+        return figure, ax
+
+    @classmethod
+    def session_figures(cls, pyramids, statistics = None, points = 4000, features = None):
+
+        figures = []
+
+        for position, row, column, title, unit, label, color in cls.SENSOR_GRAPHS:
+
+            figure, line = cls.sensor_figure(title, unit, label, color)
+            times = pyramids[position].times
+
+            if len(times):
+
+                line.set_data(*pyramids[position].query(times[0], times[-1], points))
+                line.axes.relim()
+                line.axes.autoscale_view()
+
+            figures.append(figure)
+
+        figure, ax = cls.precision_figure()
+
+        if statistics is not None:
+
+            cls.plot_precision(ax, cls.precision_by_interval(statistics))
+
+        figures.append(figure)
+
+        for row, column, title, unit, series in cls.FEATURE_GRAPHS:
+
+            figure, lines = cls.feature_figure(title, unit, series)
+
+            if features is not None:
+
+                cls.plot_features(lines, features)
+
+            figures.append(figure)
+
+        return figures
+
+    def create_graphs(self):
+
+        self.update_sensor_graphs()
+        self.update_statistics_graph()
+        self.update_feature_graphs()
+
+    def update_feature_graphs(self):
+
+        if self.emg_features is None:
+
+            for line in self.feature_lines.values():
+
+                line.set_data([], [])
+                line.axes.figure.canvas.draw_idle()
+
+            return
+
+        for ax in self.plot_features(self.feature_lines, self.emg_features):
+
+            ax.figure.canvas.draw_idle()
+
+    def update_sensor_graphs(self):
+
+        if self.sensor_pyramids is None:
+
+            return
+
+        for toolbar in self.toolbars:
+
+            toolbar.update()
+
+        for position, line in self.sensor_lines.items():
+
+            times = self.sensor_pyramids[position].times
+            ax = line.axes
+
+            self.shown_limits[position] = None
+            line.set_data(*self.sensor_pyramids[position].query(times[0], times[-1], max(int(ax.bbox.width), 1))
+                          if len(times) else ([], []))
+            ax.set_autoscale_on(True)
+            ax.relim()
+            ax.autoscale_view()
+            ax.figure.canvas.draw_idle()
+
+    def refine_sensor_graph(self, position):
+
+        if self.sensor_pyramids is None:
+
+            return
+
+        line = self.sensor_lines[position]
+        ax = line.axes
+        limits = ax.get_xlim()
+
+        if limits != self.shown_limits.get(position):
+
+            self.shown_limits[position] = limits
+            line.set_data(*self.sensor_pyramids[position].query(limits[0], limits[1], max(int(ax.bbox.width), 1)))
+            ax.figure.canvas.draw_idle()
+
+            if self.window_kpis.get() and position == self.CHANNELS[self.data_selection.get()]:
+
+                self.update_kpis()
+
+            elif self.window_kpis.get() and position == self.CHANNELS["EMG"]:
+
+                self.update_emg_kpis()
+
+    @staticmethod
+    def precision_by_interval(statistics):
+
+        if statistics.shape[1] == 3:
+
+            tempos = statistics.iloc[:, 1]
             max_tempo = tempos.max()
             intervalos_tempo = list(range(0, int(max_tempo) + 2, 2))
 
-        elif self.game_statistics.shape[1] == 4:
+        elif statistics.shape[1] == 4:
 
-            tempos = self.game_statistics.iloc[:, 1]
+            tempos = statistics.iloc[:, 1]
             max_tempo = tempos.max()
             intervalos_tempo = list(range(0, int(max_tempo) + 1))
 
@@ -272,55 +1447,168 @@ class Dashboard:
             raise ValueError("O DataFrame 'game_statistics' deve ter 3 ou 4 colunas.")
 
         grupo_tempo = pd.cut(tempos, bins = intervalos_tempo, right = False)
-        media_precisao_por_intervalo = self.game_statistics.groupby(grupo_tempo).mean().iloc[:, -1]
 
-        fig4 = Figure(figsize = (5, 2.5), dpi = 100)
-        ax4 = fig4.add_subplot(111)
+        return statistics.groupby(grupo_tempo).mean().iloc[:, -1]
+
+    @staticmethod
+    def plot_precision(ax, media_precisao_por_intervalo, bars = None):
 
         largura_barra = 0.8
 
-        ax4.bar(media_precisao_por_intervalo.index.astype(str),
-                media_precisao_por_intervalo,
-                color = "blue", 
-                label = "Média de Precisão por Intervalo de Tempo",
-                width = largura_barra)
-        ax4.set_title("Precisão Média por Intervalo de Tempo")
-        ax4.set_xlabel("Intervalos de Tempo (s)")
-        ax4.set_ylabel("Precisão Média")
-        ax4.legend(loc = 'lower right')
-        ax4.grid(True, linestyle = "--", alpha = 0.7)
-        fig4.tight_layout()
-
-        self.figures.append(fig4)
-        canvas4 = FigureCanvasTkAgg(fig4, master = self.graph_frame)
-        canvas4.get_tk_widget().grid(row = 1,
-                                     column = 1,
-                                     padx = 10,
-                                     pady = 10)
+        if bars is not None:
 
-    def show_table_window(self):
+            bars.remove()
+
+        positions = range(len(media_precisao_por_intervalo))
+        bars = ax.bar(positions,
+                      media_precisao_por_intervalo,
+                      color = "blue",
+                      label = "Média de Precisão por Intervalo de Tempo",
+                      width = largura_barra)
+        ax.set_xticks(positions, media_precisao_por_intervalo.index.astype(str))
+        ax.legend(loc = 'lower right')
+        ax.relim()
+        ax.autoscale_view()
+
+        return bars
+
+    def update_statistics_graph(self):
 
         if self.game_statistics is None:
 
-            messagebox.showwarning("Aviso", "Carregue um arquivo CSV no botão esquerdo antes de abrir a tabela.")
+            return
+
+        self.precision_bars = self.plot_precision(self.precision_axes, self.precision_by_interval(self.game_statistics), self.precision_bars)
+        self.precision_axes.figure.canvas.draw_idle()
+
+    def place_figure(self, figure, row, column, toolbar = False):
+
+        cell = tk.Frame(self.graph_frame, bg = "#FFFFFF")
+        cell.grid(row = row,
+                  column = column,
+                  padx = 10,
+                  pady = 10)
+
+        canvas = FigureCanvasTkAgg(figure, master = cell)
+
+        if toolbar:
+
+            self.toolbars.append(NavigationToolbar2Tk(canvas, cell, pack_toolbar = False))
+            self.toolbars[-1].pack(side = tk.BOTTOM, fill = tk.X)
+
+        canvas.get_tk_widget().pack(fill = tk.BOTH, expand = True)
+
+        return canvas
+
+    def table_sources(self):
+
+        sources = {}
+
+        if self.game_statistics is not None:
+
+            sources["Estatísticas do Jogo"] = (list(self.game_statistics.columns),
+                                               [self.game_statistics[name].to_numpy() for name in self.game_statistics.columns])
+
+        if self.data_right is not None:
+
+            sources["Sensores"] = (self.data_right.columns, [self.data_right.column(i) for i in range(len(self.data_right.columns))],
+                                   self.sensor_sort_indexes)
+
+        return sources
+
+    def show_table_window(self):
+
+        sources = self.table_sources()
+
+        if not sources:
+
+            messagebox.showwarning("Aviso", "Carregue as estatísticas do jogo ou os dados dos sensores antes de abrir a tabela.")
 
             return
 
         table_window = tk.Toplevel(self.root)
         table_window.title("Tabela de Dados")
-        table_window.geometry("600x400")
+        table_window.geometry("700x450")
 
-        table = ttk.Treeview(table_window, columns = list(self.game_statistics.columns), show = "headings")
-        table.pack(fill = tk.BOTH, expand = True)
+        controls = tk.Frame(table_window)
+        controls.pack(fill = tk.X, padx = 5, pady = 5)
 
-        for col in self.game_statistics.columns:
+        source = tk.StringVar(value = next(iter(sources)))
+        column = tk.StringVar()
+        low = tk.StringVar()
+        high = tk.StringVar()
+        count = tk.StringVar()
+        views = {}
 
-            table.heading(col, text = col)
-            table.column(col, width = 100)
+        table_frame = tk.Frame(table_window)
+        table_frame.pack(fill = tk.BOTH, expand = True)
+
+        source_menu = ttk.Combobox(controls, textvariable = source, values = list(sources), state = "readonly", width = 20)
+        source_menu.pack(side = tk.LEFT, padx = 5)
+        column_menu = ttk.Combobox(controls, textvariable = column, state = "readonly", width = 22)
+        column_menu.pack(side = tk.LEFT, padx = 5)
+
+        tk.Label(controls, text = "de").pack(side = tk.LEFT)
+        tk.Entry(controls, textvariable = low, width = 8).pack(side = tk.LEFT, padx = 2)
+        tk.Label(controls, text = "até").pack(side = tk.LEFT)
+        tk.Entry(controls, textvariable = high, width = 8).pack(side = tk.LEFT, padx = 2)
+
+        def show_source(event = None):
+
+            for widget in table_frame.winfo_children():
+
+                widget.pack_forget()
+
+            if source.get() not in views:
+
+                views[source.get()] = VirtualTable(table_frame, TableModel(*sources[source.get()]), status = count)
+
+            view = views[source.get()]
+            view.frame.pack(fill = tk.BOTH, expand = True)
+            column_menu.config(values = view.model.names)
+            column.set(view.model.names[0])
+            view.render()
+
+        def apply_filter(clear = False):
+
+            view = views[source.get()]
+
+            try:
+
+                bounds = [None if clear or not value.get().strip() else float(value.get().replace(",", ".")) for value in (low, high)]
 
-        for _, row in self.game_statistics.iterrows():
+            except ValueError:
 
-            table.insert("", tk.END, values=list(row))
+                messagebox.showwarning("Aviso", "Os limites do filtro devem ser números.", parent = table_window)
+
+                return
+
+            view.filter(view.model.names.index(column.get()), *bounds)
+
+        tk.Button(controls, text = "Filtrar", command = apply_filter).pack(side = tk.LEFT, padx = 5)
+        tk.Button(controls, text = "Limpar", command = lambda: apply_filter(True)).pack(side = tk.LEFT)
+        tk.Label(controls, textvariable = count).pack(side = tk.RIGHT, padx = 5)
+
+        source_menu.bind("<<ComboboxSelected>>", show_source)
+        show_source()
+
+    def report_figures(self, points = 4000):
+
+        figures = []
+
+        for figure in self.figures:
+
+            figures.append(pickle.loads(pickle.dumps(figure)))
+
+        if self.sensor_pyramids is not None:
+
+            for (position, *_), figure in zip(self.SENSOR_GRAPHS, figures):
+
+                line = figure.axes[0].lines[0]
+                limits = figure.axes[0].get_xlim()
+                line.set_data(*self.sensor_pyramids[position].query(limits[0], limits[1], points))
+
+        return figures
 
     def save_dashboard_as_pdf(self):
 
@@ -332,15 +1620,43 @@ class Dashboard:
 
         try:
 
-            screen = ImageGrab.grab(bbox = None)
-            screen.save(file_path, "PDF")
-
-            messagebox.showinfo("Sucesso", "Dashboard salvo com sucesso!")
+            kpis = {name: self.sensor_kpis.stats(position) for name, position in self.CHANNELS.items()}
+            self.report_writer = ReportWriter(file_path, self.report_figures(), kpis, self.game_statistics).start()
 
         except Exception as e:
 
             messagebox.showerror("Erro", f"Ocorreu um erro ao salvar o arquivo:\n{e}")
 
+            return
+
+        self.save_button.config(state = tk.DISABLED)
+        self.progress["value"] = 0
+        self.progress.pack(side = tk.LEFT, padx = 10)
+
+        self.poll_report_writer()
+
+    def poll_report_writer(self):
+
+        writer = self.report_writer
+        self.progress["value"] = writer.progress
+
+        if not writer.done:
+
+            self.root.after(50, self.poll_report_writer)
+
+            return
+
+        self.progress.pack_forget()
+        self.save_button.config(state = tk.NORMAL)
+
+        if writer.error is not None:
+
+            messagebox.showerror("Erro", f"Ocorreu um erro ao salvar o arquivo:\n{writer.error}")
+
+        else:
+
+            messagebox.showinfo("Sucesso", "Dashboard salvo com sucesso!")
+
     def exit_application(self):
 
         self.root.quit()
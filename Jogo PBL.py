@@ -3,12 +3,29 @@ import os
 import csv
 import math
 import time
+import bisect
+import argparse
 import random
 import serial
 import threading
+import queue
 import statistics
 import numpy as np
-from scipy.signal import butter, filtfilt
+from collections import deque
+from session_format import SessionFormat
+from session_catalog import SessionCatalog
+
+try:
+
+    import pty
+    import tty
+
+except ImportError:
+
+    pty = None
+
+from scipy.ndimage import maximum_filter
+from scipy.signal import butter, sosfilt, sosfilt_zi, sosfiltfilt
 
 class Config:
 
@@ -33,615 +50,2604 @@ class Utils:
         return max(0, 100 * (1 - (distance / max_radius))) if distance > 0 else 100.0
 
     @staticmethod
-    def draw_text(screen, text, position, font, color):
+    def rasterize_polyline(points, deduplicate = False):
 
-        text_surface = font.render(text, True, color)
-        screen.blit(text_surface, position)
+        points = np.asarray(points, dtype = np.int64).reshape(-1, 2)
 
-class DataCollector:
+        if len(points) < 2:
 
-    def __init__(self, port = "COM5", baud_rate = 9600, output_folder = "Results"):
+            return np.empty((0, 2), dtype = np.int64)
 
-        self.port = port
-        self.baud_rate = baud_rate
-        self.emg_data = []
-        self.fsr1_data = []
-        self.fsr2_data = []
-        self.time_stamps = []
-        self.ser = None
-        self.collecting = False
-        self.output_folder = output_folder
-        self.create_output_folder()
+        starts = points[:-1]
+        deltas = points[1:] - starts
+        steps = np.abs(deltas)
+        lengths = steps.max(axis = 1)
+        counts = lengths + 1
+        total = int(counts.sum())
 
-    def create_output_folder(self):
+        k = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        span = np.repeat(np.maximum(lengths, 1), counts)
+        numerator_offset = span - 1
+        denominator = 2 * span
+        k_twice = 2 * k
 
-        if not os.path.exists(self.output_folder):
+        pixels = np.empty((total, 2), dtype = np.int64)
 
-            os.makedirs(self.output_folder)
+        for axis in (0, 1):
 
-    def start_collection(self):
+            advance = (k_twice * np.repeat(steps[:, axis], counts) + numerator_offset) // denominator
+            pixels[:, axis] = np.repeat(starts[:, axis], counts) + np.repeat(np.sign(deltas[:, axis]), counts) * advance
 
-        if self.ser is None or not self.ser.is_open:
+        if deduplicate:
 
-            try:
+            pixels = Utils.unique_pixels(pixels)
 
-                self.ser = serial.Serial(self.port, self.baud_rate, timeout = 1)
+        return pixels
 
-                time.sleep(1)
+    @staticmethod
+    def unique_pixels(pixels):
 
-                self.collecting = True
+        if not len(pixels):
 
-                threading.Thread(target = self.read_data, daemon = True).start()
+            return pixels
 
-                print("Coleta de dados iniciada.")
+        origin = pixels.min(axis = 0)
+        height = int(pixels[:, 1].max() - origin[1]) + 1
+        flat = (pixels[:, 0] - origin[0]) * height + (pixels[:, 1] - origin[1])
+        size = int(flat.max()) + 1
 
-            except serial.SerialException as e:
+        if size <= 4 * len(flat) + (1 << 20):
 
-                print(f"Erro ao conectar ao dispositivo serial: {e}")
+            seen = np.zeros(size, dtype = bool)
+            seen[flat] = True
+            flat = np.flatnonzero(seen)
 
-    def stop_collection(self):
+        else:
 
-        self.collecting = False
+            flat = np.unique(flat)
 
-        if self.ser and self.ser.is_open:
+        return np.column_stack((flat // height + origin[0], flat % height + origin[1]))
 
-            self.ser.close()
+    @staticmethod
+    def segment_closest_points(starts, ends, point):
 
-            print("Conexão serial encerrada.")
+        point = np.asarray(point, dtype = float)
+        deltas = ends - starts
+        offsets = point - starts
+        lengths = (deltas * deltas).sum(axis = 1)
+        t = np.clip((offsets * deltas).sum(axis = 1) / np.where(lengths == 0, 1, lengths), 0, 1)
+        closest = starts + t[:, None] * deltas
 
-    def read_data(self):
+        return np.hypot(closest[:, 0] - point[0], closest[:, 1] - point[1]), closest
 
-        try:
+    @staticmethod
+    def draw_text(screen, text, position, font, color):
 
-            while self.collecting:
+        text_surface = font.render(text, True, color)
+        screen.blit(text_surface, position)
 
-                if self.ser.in_waiting > 0:
+class Profiler:
 
-                    line = self.ser.readline().decode("utf-8").strip()
+    EDGES = [10 ** (exponent / 20) for exponent in range(-120, 121)]
 
-                    try:
+    def __init__(self):
 
-                        emg_str, fsr1_str, fsr2_str = line.split(",")
+        self.histograms = {}
+        self.totals = {}
+        self.maxima = {}
+        self.frame_start = None
+        self.last_lap = None
+        self.rate_windows = {}
 
-                        emg_value = float(emg_str)
-                        fsr1_value = float(fsr1_str)
-                        fsr2_value = float(fsr2_str)
-                        self.emg_data.append(emg_value)
-                        self.fsr1_data.append(fsr1_value)
-                        self.fsr2_data.append(fsr2_value)
-                        self.time_stamps.append(time.time())
+    def record(self, name, value):
 
-                    except ValueError:
+        counts = self.histograms.get(name)
 
-                        continue
+        if counts is None:
 
-                time.sleep(0.1)
+            counts = self.histograms.setdefault(name, [0] * (len(self.EDGES) + 1))
 
-        except serial.SerialException:
+        counts[bisect.bisect_left(self.EDGES, value)] += 1
+        self.totals[name] = self.totals.get(name, 0) + value
+        self.maxima[name] = max(self.maxima.get(name, value), value)
 
-            print("Erro na comunicação com o dispositivo serial.")
+    def record_rate(self, name, amount, window = 1.0):
 
-    def apply_bandpass_filter(self, data, lowcut = 20, highcut = 500, fs = 1000, order = 4):
+        now = time.perf_counter()
+        start, total = self.rate_windows.get(name, (now, 0))
+        total += amount
 
-        nyquist = 0.5 * fs
-        low = lowcut / nyquist
-        high = highcut / nyquist
-        b, a = butter(order, [low, high], btype = 'band')
+        if now - start >= window:
 
-        return filtfilt(b, a, data)
+            self.record(name, total / (now - start))
+            start, total = now, 0
 
-    def apply_moving_average(self, data, window_size = 5):
+        self.rate_windows[name] = (start, total)
 
-        return np.convolve(data, np.ones(window_size) / window_size, mode = 'same')
+    def start_frame(self):
 
-    def process_data(self):
+        now = time.perf_counter()
 
-        if self.emg_data:
+        if self.frame_start is not None:
 
-            self.emg_data = self.apply_bandpass_filter(self.emg_data)
+            self.record("frame_interval", now - self.frame_start)
 
-        if self.fsr2_data:
+        self.frame_start = self.last_lap = now
 
-            self.fsr2_data = self.apply_moving_average(self.fsr2_data)
+    def reset_frames(self):
 
-    def save_sensor_data_to_csv(self, filename = "sensor_data.csv"):
+        self.frame_start = None
 
-        if not self.time_stamps:
+    def lap(self, name):
 
-            return
+        now = time.perf_counter()
+        self.record(name, now - self.last_lap)
+        self.last_lap = now
 
-        csv_path = os.path.join(self.output_folder, filename)
+    def end_frame(self):
 
-        with open(csv_path, mode = "w", newline = "", encoding = "utf-8") as file:
+        self.record("frame", time.perf_counter() - self.frame_start)
 
-            writer = csv.writer(file)
-            writer.writerow(["Tempo (s)", "Eletromiografia (μV)", "Força no Antebraço (N)", "Força no Dedo (N)"])
-            relative_time = [t - self.time_stamps[0] for t in self.time_stamps]
+    def count(self, name):
 
-            for t, emg, fsr1, fsr2 in zip(relative_time, self.emg_data, self.fsr1_data, self.fsr2_data):
+        return sum(self.histograms.get(name, ()))
 
-                writer.writerow([f"{t:.2f}", f"{emg:.2f}", f"{fsr1:.2f}", f"{fsr2:.2f}"])
+    def percentile(self, name, q):
 
-class PhaseOne:
+        counts = self.histograms.get(name)
 
-    def __init__(self, output_folder = "Results"):
+        if not counts:
 
-        super().__init__()
+            return 0
 
-        self.clicks = 0
-        self.points = 0
-        self.clicks_to_hit = 0
-        self.max_time = 10
-        self.phase_goal = 100
-        self.start_time = time.time()
-        self.target = self.create_target()
-        self.last_target_time = time.time()
-        self.target_creation_time = time.time()
-        self.target_data = []
-        self.output_folder = output_folder
+        target = q / 100 * sum(counts)
+        cumulative = 0
 
-    def display_dashboard(self, screen, font):
+        for i, count in enumerate(counts):
 
-        elapsed_time = time.time() - self.start_time
+            cumulative += count
 
-        Utils.draw_text(screen, f"Tempo: {int(elapsed_time)} segundos", (10, 10), font, Config.COLORS["BLACK"])
-        Utils.draw_text(screen, f"Cliques: {self.clicks}", (10, 50), font, Config.COLORS["BLACK"])
-        Utils.draw_text(screen, f"Pontos: {self.points} / {self.phase_goal}", (10, 90), font, Config.COLORS["BLACK"])
+            if count and cumulative >= target:
 
-    def calculate_statistics(self):
+                upper = self.EDGES[i] if i < len(self.EDGES) else self.maxima[name]
 
-        if not self.target_data:
+                return min(upper, self.maxima[name])
 
-            return {k: 0 for k in ("time_mean", "time_stdev", "clicks_mean", "clicks_stdev", "precision_mean", "precision_stdev")}
+        return self.maxima[name]
 
-        times = [d["time"] for d in self.target_data]
-        clicks = [d["clicks"] for d in self.target_data]
-        precisions = [d["precision"] for d in self.target_data]
+    def summary(self):
 
-        return {"time_mean": statistics.mean(times),
-                "time_stdev": statistics.stdev(times) if len(times) > 1 else 0,
-                "clicks_mean": statistics.mean(clicks),
-                "clicks_stdev": statistics.stdev(clicks) if len(clicks) > 1 else 0,
-                "precision_mean": statistics.mean(precisions),
-                "precision_stdev": statistics.stdev(precisions) if len(precisions) > 1 else 0}
+        rows = []
 
-    def create_target(self):
+        for name in sorted(self.histograms):
 
-        return (random.randint(50, Config.SCREEN_WIDTH - 110),
-                random.randint(50, Config.SCREEN_HEIGHT - 110),
-                random.randint(10, 110))
+            count = self.count(name)
+            rows.append({"metric": name,
+                         "count": count,
+                         "mean": self.totals[name] / count if count else 0,
+                         "p50": self.percentile(name, 50),
+                         "p90": self.percentile(name, 90),
+                         "p99": self.percentile(name, 99),
+                         "max": self.maxima.get(name, 0)})
 
-    def update_target(self):
+        return rows
 
-        self.clicks_to_hit = 0
-        self.target = self.create_target()
-        self.last_target_time = time.time()
-        self.target_creation_time = time.time()
+    def save(self, output_folder, filename = "profile.csv"):
 
-    def check_target_timeout(self):
+        if not self.histograms:
 
-        if time.time() - self.last_target_time > self.max_time:
+            return
 
-            self.target = self.create_target()
-            self.last_target_time = time.time()
+        with open(os.path.join(output_folder, filename), mode = "w", newline = "") as file:
 
-    def handle_click(self, mouse_pos):
+            writer = csv.writer(file)
+            writer.writerow(["Métrica", "Amostras", "Média", "p50", "p90", "p99", "Máximo"])
 
-        self.clicks += 1
-        self.clicks_to_hit += 1
+            for row in self.summary():
 
-        distance = Utils.calculate_distance(mouse_pos, (self.target[0], self.target[1]))
+                writer.writerow([row["metric"], row["count"]] + [f"{row[key]:.6g}" for key in ("mean", "p50", "p90", "p99", "max")])
 
-        if distance <= self.target[2]:
+        histogram_name = os.path.splitext(filename)[0] + "_histogram.csv"
 
-            self.points += self.calculate_score(distance)
+        with open(os.path.join(output_folder, histogram_name), mode = "w", newline = "") as file:
 
-            time_to_hit = time.time() - self.last_target_time
-            precision = Utils.calculate_precision(distance, self.target[2])
-            self.target_data.append({"time": time_to_hit,
-                                     "clicks": self.clicks_to_hit,
-                                     "precision": precision})
+            writer = csv.writer(file)
+            writer.writerow(["Métrica", "Limite Inferior", "Limite Superior", "Amostras"])
 
-            self.update_target()
+            for name in sorted(self.histograms):
 
-    def calculate_score(self, distance):
+                for i, count in enumerate(self.histograms[name]):
 
-        if self.target[2] <= 30:
+                    if count:
 
-            section_scores = [9, 10, 11, 12, 13]
+                        lower = self.EDGES[i - 1] if i > 0 else 0
+                        upper = self.EDGES[i] if i < len(self.EDGES) else float("inf")
+                        writer.writerow([name, f"{lower:.6g}", f"{upper:.6g}", count])
 
-        elif self.target[2] <= 50:
+class SampleBuffer:
 
-            section_scores = [7, 8, 9, 10, 11]
+    def __init__(self, channels = 4, capacity = 65536):
 
-        elif self.target[2] <= 70:
+        self.channels = channels
+        self._state = (np.empty((channels, capacity)), 0)
+        self._write_lock = threading.Lock()
 
-            section_scores = [5, 6, 7, 8, 9]
+    def __len__(self):
 
-        elif self.target[2] <= 90:
+        return self._state[1]
 
-            section_scores = [3, 4, 5, 6, 7]
+    @property
+    def capacity(self):
 
-        else:
+        return self._state[0].shape[1]
 
-            section_scores = [1, 2, 3, 4, 5]
+    def append(self, row):
 
-        if distance <= self.target[2] * (1 / 5):
+        self.extend(np.asarray(row, dtype = float).reshape(self.channels, 1))
 
-            return section_scores[4]
+    def extend(self, block):
 
-        elif distance <= self.target[2] * (2 / 5):
+        block = np.asarray(block, dtype = float)
+        count = block.shape[1]
 
-            return section_scores[3]
+        with self._write_lock:
 
-        elif distance <= self.target[2] * (3 / 5):
+            data, size = self._state
 
-            return section_scores[2]
+            if size + count > data.shape[1]:
 
-        elif distance <= self.target[2] * (4 / 5):
+                data = self._grow(data, size, size + count)
 
-            return section_scores[1]
+            data[:, size:size + count] = block
+            self._state = (data, size + count)
 
-        else:
+    def _grow(self, data, size, required):
 
-            return section_scores[0]
+        capacity = max(data.shape[1], 1)
 
-    def save_statistics_to_csv(self, filename = "phase_one.csv"):
+        while capacity < required:
 
-        if not self.target_data:
+            capacity *= 2
 
-            return
+        grown = np.empty((self.channels, capacity))
+        grown[:, :size] = data[:, :size]
 
-        csv_path = os.path.join(self.output_folder, filename)
+        return grown
 
-        with open(csv_path, mode = "w", newline = "") as file:
+    def view(self):
 
-            writer = csv.writer(file)
-            writer.writerow(["Interação", "Tempo (s)", "Cliques", "Precisão (%)"])
+        data, size = self._state
 
-            for i, d in enumerate(self.target_data, start = 1):
+        return data[:, :size]
 
-                writer.writerow([i, f"{d['time']:.2f}", d["clicks"], f"{d['precision']:.2f}"])
+    def channel(self, index):
 
-class PhaseTwo: 
+        data, size = self._state
 
-    def __init__(self, output_folder = "Results"):
+        return data[index, :size]
 
-        super().__init__()
+    def latest(self, count):
 
-        self.level = 0
-        self.total_levels = 3
-        self.checkpoints = self.generate_checkpoints()
-        self.current_checkpoints = self.checkpoints.copy()
-        self.checkpoint_status = [False] * len(self.checkpoints)
-        self.user_line = []
-        self.draw_data = []
-        self.start_time = None
-        self.user_active = False
-        self.output_folder = output_folder
+        data, size = self._state
 
-    def display_dashboard(self, screen, font):
+        return data[:, max(0, size - count):size]
 
-        elapsed_time = 0 if self.start_time is None else time.time() - self.start_time
+    def clear(self):
 
-        Utils.draw_text(screen, f"Tempo: {int(elapsed_time)} segundos", (10, 10), font, Config.COLORS["BLACK"])
-        Utils.draw_text(screen, f"Checkpoints: {self.checkpoint_status.count(True)} / {len(self.checkpoints)}", (10, 50), font, Config.COLORS["BLACK"])
+        with self._write_lock:
 
-    def calculate_statistics(self):
+            self._state = (self._state[0], 0)
 
-        if not self.draw_data:
+class LineParser:
 
-            return {k: 0 for k in ("time_mean", "time_stdev", "precision_mean", "precision_stdev")}
+    def __init__(self, columns = 3, max_line_length = 256):
 
-        times = [d["time"] for d in self.draw_data]
-        precisions = [d["precision"] for d in self.draw_data]
+        self.columns = columns
+        self.max_line_length = max_line_length
+        self.lines_parsed = 0
+        self.malformed_lines = 0
+        self.dropped_bytes = 0
+        self._tail = b""
 
-        return {"time_mean": statistics.mean(times),
-                "time_stdev": statistics.stdev(times) if len(times) > 1 else 0,
-                "precision_mean": statistics.mean(precisions),
-                "precision_stdev": statistics.stdev(precisions) if len(precisions) > 1 else 0}
+    def feed(self, chunk):
 
-    def handle_event(self, event):
+        lines = (self._tail + chunk).split(b"\n")
+        self._tail = lines.pop()
 
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        if len(self._tail) > self.max_line_length:
 
-            self.user_active, self.user_line = True, [pygame.mouse.get_pos()]
-            self.start_time = time.time()
+            self.dropped_bytes += len(self._tail)
+            self._tail = b""
 
-        elif event.type == pygame.MOUSEMOTION and self.user_active:
+        lines = [line.strip() for line in lines]
+        lines = [line for line in lines if line]
+        valid = [line for line in lines if line.count(b",") == self.columns - 1]
+        self.malformed_lines += len(lines) - len(valid)
 
-            self.user_line.append(pygame.mouse.get_pos())
+        if not valid:
 
-            for i, cp in enumerate(self.checkpoints):
+            return np.empty((0, self.columns))
 
-                if i == 0 or self.checkpoint_status[i - 1]:
+        try:
 
-                    if (not self.checkpoint_status[i] and 
-                        math.hypot(cp[0] - self.user_line[-1][0], cp[1] - self.user_line[-1][1]) <= 10):
+            values = np.array(b",".join(valid).split(b","), dtype = float).reshape(-1, self.columns)
 
-                        self.checkpoint_status[i] = True
+        except ValueError:
 
-        elif event.type == pygame.MOUSEBUTTONUP and self.user_active:
+            values = self.parse_lines(valid)
 
-            self.advance_level()
+        self.lines_parsed += len(values)
 
-            self.user_line, self.start_time, self.user_active = [], None, False
+        return values
 
-    def advance_level(self):
+    def parse_lines(self, lines):
 
-        if all(self.checkpoint_status):
+        rows = []
 
-            self.level += 1
-            self.current_checkpoints = self.checkpoints.copy()
+        for line in lines:
 
-            elapsed_time = time.time() - self.start_time
-            accuracy = self.calculate_accuracy()
-            self.draw_data.append({"time": elapsed_time,
-                                   "precision": accuracy})
+            try:
 
-            if self.level == self.total_levels:
+                rows.append([float(value) for value in line.split(b",")])
 
-                return False
+            except ValueError:
 
-            self.checkpoints = self.generate_checkpoints()
-            self.checkpoint_status = [False] * len(self.checkpoints)
+                self.malformed_lines += 1
 
-        return True
+        return np.array(rows, dtype = float).reshape(-1, self.columns)
 
-    def generate_checkpoints(self, num_checkpoints = 5):
+    def report(self):
 
-        return [(random.randint(100, Config.SCREEN_WIDTH - 100),
-                 random.randint(100, Config.SCREEN_HEIGHT - 100)) for _ in range(num_checkpoints)]
+        if self.malformed_lines or self.dropped_bytes:
 
-    def draw_checkpoints_and_lines(self, screen, font):
+            return f"Linhas inválidas: {self.malformed_lines}, bytes descartados: {self.dropped_bytes}"
 
-        pygame.draw.lines(screen, Config.COLORS["BLACK"], False, self.checkpoints, 5)
+        return None
 
-        for i, (point, status) in enumerate(zip(self.checkpoints, self.checkpoint_status)):
+class FrameDecoder:
 
-            color = Config.COLORS["GREEN"] if status else Config.COLORS["RED"]
-            pygame.draw.circle(screen, color, point, 10)
-            checkpoint_text = font.render(str(i + 1), True, Config.COLORS["BLACK"])
-            screen.blit(checkpoint_text, (point[0] - 10, point[1] - 10))
+    SYNC = b"\xa5\x5a"
+    FRAME = np.dtype([("sync", "<u2"), ("sequence", "<u2"), ("values", "<f4", (3,)), ("checksum", "u1")])
 
-    def draw_user_line(self, screen):
+    def __init__(self):
 
-        if len(self.user_line) > 1:
+        self.frames_decoded = 0
+        self.dropped_frames = 0
+        self.corrupt_bytes = 0
+        self.resyncs = 0
+        self.last_index = None
+        self.indices = np.empty(0, dtype = np.int64)
+        self._tail = b""
 
-            pygame.draw.lines(screen, Config.COLORS["BLUE"], False, self.user_line, 3)
+    @classmethod
+    def encode(cls, values, first_sequence = 0):
 
-    def rasterize_line(self, start, end):
+        values = np.asarray(values, dtype = float).reshape(-1, 3)
+        frames = np.zeros(len(values), dtype = cls.FRAME)
+        frames["sync"] = np.frombuffer(cls.SYNC, dtype = "<u2")[0]
+        frames["sequence"] = (first_sequence + np.arange(len(values))) & 0xFFFF
+        frames["values"] = values
+        raw = frames.view(np.uint8).reshape(len(values), cls.FRAME.itemsize)
+        frames["checksum"] = np.bitwise_xor.reduce(raw[:, 2:-1], axis = 1)
 
-        pixels = []
-        x1, y1 = start
-        x2, y2 = end
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        sx = 1 if x1 < x2 else -1
-        sy = 1 if y1 < y2 else -1
-        err = dx - dy
+        return frames.tobytes()
+
+    def feed(self, chunk):
+
+        buffer = self._tail + chunk
+        size = self.FRAME.itemsize
+        sync = np.frombuffer(self.SYNC, dtype = "<u2")[0]
+        batches = []
+        position = 0
 
         while True:
 
-            pixels.append((x1, y1))
+            start = buffer.find(self.SYNC, position)
 
-            if x1 == x2 and y1 == y2:
+            if start < 0:
+
+                keep = 1 if buffer.endswith(self.SYNC[:1]) else 0
+                self.corrupt_bytes += len(buffer) - position - keep
+                self._tail = buffer[len(buffer) - keep:]
 
                 break
 
-            e2 = err * 2
+            self.corrupt_bytes += start - position
+            count = (len(buffer) - start) // size
 
-            if e2 > -dy:
+            if not count:
 
-                err -= dy
-                x1 += sx
+                self._tail = buffer[start:]
 
-            if e2 < dx:
+                break
 
-                err += dx
-                y1 += sy
+            frames = np.frombuffer(buffer, dtype = self.FRAME, count = count, offset = start)
+            raw = np.frombuffer(buffer, dtype = np.uint8, count = count * size, offset = start).reshape(count, size)
+            valid = (frames["sync"] == sync) & (np.bitwise_xor.reduce(raw[:, 2:-1], axis = 1) == raw[:, -1])
+            invalid = np.flatnonzero(~valid)
+            good = count if not len(invalid) else int(invalid[0])
 
-        return pixels
+            if good:
 
-    def calculate_accuracy(self, tolerance = 5):
+                batches.append(frames[:good])
 
-        if not self.user_line or not self.current_checkpoints:
+            position = start + good * size
 
-            return 0
+            if good < count:
 
-        user_pixels = []
+                self.resyncs += 1
+                self.corrupt_bytes += 1
+                position += 1
 
-        for i in range(len(self.user_line) - 1):
+            else:
 
-            user_pixels.extend(self.rasterize_line(self.user_line[i], self.user_line[i + 1]))
+                self._tail = buffer[position:]
 
-        target_pixels = []
+                break
 
-        for i in range(len(self.current_checkpoints) - 1):
+        if not batches:
 
-            target_pixels.extend(self.rasterize_line(self.current_checkpoints[i], self.current_checkpoints[i + 1]))
+            self.indices = np.empty(0, dtype = np.int64)
 
-        user_pixels_set = set(user_pixels)
-        target_pixels_set = set(target_pixels)
+            return np.empty((0, 3))
 
-        def is_within_tolerance(pixel1, pixel2, tolerance):
+        frames = np.concatenate(batches)
+        self.track_sequence(frames["sequence"].astype(np.int64))
+        self.frames_decoded += len(frames)
 
-            return abs(pixel1[0] - pixel2[0]) <= tolerance and abs(pixel1[1] - pixel2[1]) <= tolerance
+        return frames["values"].astype(float)
 
-        intersection = set()
+    def track_sequence(self, sequence):
 
-        for user_pixel in user_pixels_set:
+        previous = sequence[0] - 1 if self.last_index is None else self.last_index
+        steps = (np.diff(sequence, prepend = previous) & 0xFFFF)
+        steps[steps == 0] = 1
+        self.dropped_frames += int((steps - 1).sum())
+        self.indices = previous + np.cumsum(steps)
+        self.last_index = int(self.indices[-1])
 
-            for target_pixel in target_pixels_set:
+    def report(self):
 
-                if is_within_tolerance(user_pixel, target_pixel, tolerance):
+        if self.dropped_frames or self.corrupt_bytes:
 
-                    intersection.add(user_pixel)
+            return (f"Quadros perdidos: {self.dropped_frames}, bytes corrompidos: {self.corrupt_bytes}, "
+                    f"ressincronizações: {self.resyncs}")
 
-                    break
+        return None
 
-        if len(target_pixels_set) == 0:
+class StreamingFilter:
 
-            return 0
+    _sos_cache = {}
 
-        return (len(intersection) / len(user_pixels_set)) * 100
+    def __init__(self, lowcut = 20, highcut = 500, fs = 1000, order = 4):
 
-    def save_statistics_to_csv(self, filename = "phase_two.csv"):
+        self.lowcut = lowcut
+        self.highcut = highcut
+        self.fs = fs
+        self.order = order
+        self.sos = self.design(lowcut, highcut, fs, order)
+        self.zi = None
 
-        if not self.draw_data:
+    @classmethod
+    def design(cls, lowcut, highcut, fs, order):
 
-            return
+        key = (order, lowcut, highcut, fs)
 
-        csv_path = os.path.join(self.output_folder, filename)
+        if key not in cls._sos_cache:
 
-        with open(csv_path, mode = "w", newline = "") as file:
+            nyquist = 0.5 * fs
 
-            writer = csv.writer(file)
-            writer.writerow(["Nível", "Tempo (s)", "Precisão (%)"])
+            if lowcut >= nyquist:
 
-            for i, d in enumerate(self.draw_data, start = 1):
+                sos = None
 
-                writer.writerow([i, f"{d['time']:.2f}", f"{d['precision']:.2f}"])
+            elif highcut >= nyquist:
 
-class Game:
+                sos = butter(order, lowcut / nyquist, btype = "highpass", output = "sos")
 
-    def __init__(self):
+            else:
 
-        pygame.init()
-        pygame.display.set_caption("Jogo de Precisão")
+                sos = butter(order, [lowcut / nyquist, highcut / nyquist], btype = "band", output = "sos")
 
-        self.font = pygame.font.Font(None, 36)
-        self.clock = pygame.time.Clock()
-        self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+            cls._sos_cache[key] = sos
 
-        self.phase_one_complete = False
-        self.data_collector_one = DataCollector()
-        self.phase_two_complete = False
-        self.data_collector_two = DataCollector()
+        return cls._sos_cache[key]
 
-    def display_message_while_collecting(self, message, collector_function):
+    def process(self, chunk):
 
-        start_time = pygame.time.get_ticks()
-        collector_function()
+        chunk = np.asarray(chunk, dtype = float)
 
-        while True:
+        if not len(chunk) or self.sos is None:
 
-            self.screen.fill(Config.COLORS["WHITE"])
-            text = self.font.render(message, True, Config.COLORS["BLACK"])
-            text_rect = text.get_rect(center = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2))
-            self.screen.blit(text, text_rect)
+            return chunk
 
-            pygame.display.flip()
+        if self.zi is None:
 
-            current_time = pygame.time.get_ticks()
+            self.zi = sosfilt_zi(self.sos) * chunk[0]
 
-            if current_time - start_time > 1000:
+        filtered, self.zi = sosfilt(self.sos, chunk, zi = self.zi)
 
-                break
+        return filtered
 
-            for event in pygame.event.get():
+    def reset(self):
 
-                if event.type == pygame.QUIT:
+        self.zi = None
 
-                    pygame.quit()
+    def retune(self, fs, tolerance = 0.02):
 
-    def final_display_message(self, message):
+        if abs(fs - self.fs) <= tolerance * self.fs:
 
-        self.screen.fill(Config.COLORS["WHITE"])
-        text = self.font.render(message, True, Config.COLORS["BLACK"])
-        text_rect = text.get_rect(center = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2))
-        self.screen.blit(text, text_rect)
+            return False
 
-        pygame.display.flip()
+        fs = round(fs, 1)
+        sos = self.design(self.lowcut, self.highcut, fs, self.order)
 
-        time.sleep(0.9)
+        if sos is None or self.sos is None or sos.shape != self.sos.shape:
 
-    def run(self):
+            self.zi = None
 
-        self.display_message_while_collecting("Fase 1: Iniciando...", self.data_collector_one.start_collection)
-        phase_one = PhaseOne()
-        phase_one_running = True
+        self.fs = fs
+        self.sos = sos
 
-        while phase_one_running:
+        return True
 
-            self.screen.fill(Config.COLORS["WHITE"])
-            phase_one.display_dashboard(self.screen, self.font)
+    def finalize(self, data):
 
-            pygame.draw.circle(self.screen, Config.COLORS["RED"], (phase_one.target[0], phase_one.target[1]), phase_one.target[2])
-            pygame.draw.circle(self.screen, Config.COLORS["WHITE"], (phase_one.target[0], phase_one.target[1]), int(phase_one.target[2] * (4 / 5)))
-            pygame.draw.circle(self.screen, Config.COLORS["RED"], (phase_one.target[0], phase_one.target[1]), int(phase_one.target[2] * (3 / 5)))
-            pygame.draw.circle(self.screen, Config.COLORS["WHITE"], (phase_one.target[0], phase_one.target[1]), int(phase_one.target[2] * (2 / 5)))
-            pygame.draw.circle(self.screen, Config.COLORS["BLACK"], (phase_one.target[0], phase_one.target[1]), int(phase_one.target[2] * (1 / 5)))
+        if self.sos is None:
 
-            for event in pygame.event.get():
+            return np.asarray(data, dtype = float)
 
-                if event.type == pygame.QUIT:
+        return sosfiltfilt(self.sos, data)
 
-                    phase_one_running = False
+class SampleClock:
 
-                elif event.type == pygame.MOUSEBUTTONDOWN:
+    def __init__(self, nominal_rate = 1000, window = 60.0, min_span = 0.5, max_batches = 4096):
 
-                    phase_one.handle_click(pygame.mouse.get_pos())
+        self.nominal_rate = nominal_rate
+        self.rate = float(nominal_rate)
+        self.window = window
+        self.min_span = min_span
+        self.batches = deque(maxlen = max_batches)
+        self.origin = None
+        self.first_index = None
+        self.next_index = 0
 
-            if phase_one.points >= phase_one.phase_goal:
+    def reset(self):
 
-                phase_one_running = False
+        self.rate = float(self.nominal_rate)
+        self.batches.clear()
+        self.origin = None
+        self.first_index = None
+        self.next_index = 0
 
-            pygame.display.flip()
-            self.clock.tick(Config.FPS)
+    def observe(self, count, arrival, indices = None):
 
-        self.final_display_message("Fase 1: Concluída!")
-        self.data_collector_one.stop_collection()
-        self.phase_one_complete = True
+        if indices is None:
 
-        phase_one.save_statistics_to_csv("phase_one.csv")
-        self.data_collector_one.save_sensor_data_to_csv("phase_one_sensor_data.csv")
+            indices = self.next_index + np.arange(count)
 
-        while not self.phase_one_complete:
+        else:
 
-            time.sleep(0.1)
+            if self.first_index is None:
 
-        self.display_message_while_collecting("Fase 2: Iniciando...", self.data_collector_two.start_collection)
-        phase_two = PhaseTwo()
-        phase_two_running = True
+                self.first_index = int(indices[0])
 
-        while phase_two_running:
+            indices = np.asarray(indices, dtype = np.int64) - self.first_index
+
+        self.next_index = int(indices[-1]) + 1
+        self.batches.append((self.next_index - 1, arrival))
+
+        while len(self.batches) > 2 and arrival - self.batches[0][1] > self.window:
+
+            self.batches.popleft()
+
+        self.estimate()
+
+        return indices
+
+    def estimate(self):
+
+        batches = np.array(self.batches, dtype = float)
+        ends, arrivals = batches[:, 0], batches[:, 1]
+
+        if arrivals[-1] - arrivals[0] >= self.min_span:
+
+            centered = ends - ends.mean()
+            slope = (centered * (arrivals - arrivals.mean())).sum() / (centered ** 2).sum()
+
+            if slope > 0:
+
+                self.rate = 1 / slope
+
+        self.origin = float((arrivals - ends / self.rate).min())
+
+    def times(self, indices):
+
+        return self.origin + np.asarray(indices) / self.rate
+
+class SyntheticSignal:
+
+    def __init__(self, rate = 1000, seed = 0, emg_noise = 50, emg_burst = 150, force_noise = 0.1):
+
+        self.rate = rate
+        self.rng = np.random.default_rng(seed)
+        self.emg_noise = emg_noise
+        self.emg_burst = emg_burst
+        self.force_noise = force_noise
+        self.generated = 0
+
+    def generate(self, count):
+
+        t = (self.generated + np.arange(count)) / self.rate
+        contraction = np.sin(2 * np.pi * 0.25 * t) > 0
+        emg = self.rng.normal(0, 1, count) * (self.emg_noise + self.emg_burst * contraction)
+        fsr1 = 5 + 3 * np.sin(2 * np.pi * 0.2 * t) + self.rng.normal(0, self.force_noise, count)
+        fsr2 = 2 + 1.5 * np.sin(2 * np.pi * 0.35 * t + 1) + self.rng.normal(0, self.force_noise, count)
+        self.generated += count
+
+        return np.column_stack((emg, fsr1, fsr2))
+
+    @staticmethod
+    def encode_lines(values):
+
+        return "".join(f"{emg:.2f},{fsr1:.2f},{fsr2:.2f}\r\n" for emg, fsr1, fsr2 in values.tolist()).encode("ascii")
+
+    @staticmethod
+    def encode(values, protocol = "csv", first_index = 0):
+
+        if protocol == "binary":
+
+            return FrameDecoder.encode(values, first_index)
+
+        return SyntheticSignal.encode_lines(values)
+
+class SyntheticSerial:
+
+    def __init__(self, signal, timeout = None, protocol = "csv"):
+
+        self.port = "SIM"
+        self.timeout = timeout
+        self.signal = signal
+        self.protocol = protocol
+        self.start = time.perf_counter()
+        self.pending = b""
+        self.is_open = True
+
+    def fill(self):
+
+        due = int((time.perf_counter() - self.start) * self.signal.rate) - self.signal.generated
+
+        if due > 0:
+
+            first_index = self.signal.generated
+            self.pending += SyntheticSignal.encode(self.signal.generate(due), self.protocol, first_index)
+
+    @property
+    def in_waiting(self):
+
+        self.fill()
+
+        return len(self.pending)
+
+    def read(self, size = 1):
+
+        deadline = None if self.timeout is None else time.perf_counter() + self.timeout
+        self.fill()
+
+        while len(self.pending) < size and (deadline is None or time.perf_counter() < deadline):
+
+            time.sleep(0.001)
+            self.fill()
+
+        data, self.pending = self.pending[:size], self.pending[size:]
+
+        return data
+
+    def readline(self):
+
+        line = b""
+
+        while not line.endswith(b"\n"):
+
+            chunk = self.read(1)
+
+            if not chunk:
+
+                break
+
+            line += chunk
+
+        return line
+
+    def close(self):
+
+        self.is_open = False
+
+class SerialSource:
+
+    settle_time = 1
+
+    def __init__(self, port = "COM5", baud_rate = 9600):
+
+        self.port = port
+        self.baud_rate = baud_rate
+
+    def open(self, timeout):
+
+        return serial.Serial(self.port, self.baud_rate, timeout = timeout)
+
+    def close(self):
+
+        pass
+
+class SyntheticSource:
+
+    settle_time = 0
+
+    def __init__(self, rate = 1000, seed = 0, protocol = "csv", **noise):
+
+        self.rate = rate
+        self.seed = seed
+        self.protocol = protocol
+        self.noise = noise
+
+    def open(self, timeout):
+
+        return SyntheticSerial(SyntheticSignal(self.rate, self.seed, **self.noise), timeout, self.protocol)
+
+    def close(self):
+
+        pass
+
+class PtySource:
+
+    settle_time = 0
+
+    def __init__(self, interval = 0.002, max_pending = 65536, drop_when_full = True, protocol = "csv"):
+
+        self.interval = interval
+        self.max_pending = max_pending
+        self.drop_when_full = drop_when_full
+        self.protocol = protocol
+        self.master = None
+        self.writer_thread = None
+        self.running = False
+        self.pending = b""
+        self.sent_samples = 0
+        self.dropped_samples = 0
+        self.finished = False
+
+    def open(self, timeout):
+
+        if pty is None:
+
+            raise serial.SerialException("Dispositivos virtuais exigem pseudo-terminais (Linux ou macOS).")
+
+        self.master, slave = pty.openpty()
+        tty.setraw(slave)
+
+        connection = serial.Serial(os.ttyname(slave), timeout = timeout)
+        os.close(slave)
+        os.set_blocking(self.master, False)
+
+        self.running = True
+        self.writer_thread = threading.Thread(target = self.write_loop, daemon = True)
+        self.writer_thread.start()
+
+        return connection
+
+    def close(self):
+
+        self.running = False
+
+        if self.writer_thread is not None:
+
+            self.writer_thread.join(timeout = 2)
+            self.writer_thread = None
+
+        if self.master is not None:
+
+            os.close(self.master)
+            self.master = None
+
+    def produce(self, elapsed):
+
+        return np.empty((0, 3))
+
+    def write_loop(self):
+
+        start = time.perf_counter()
+
+        while self.running:
+
+            if self.drop_when_full or len(self.pending) < self.max_pending:
+
+                values = self.produce(time.perf_counter() - start)
+
+                if len(self.pending) >= self.max_pending:
+
+                    self.dropped_samples += len(values)
+
+                elif len(values):
+
+                    self.pending += SyntheticSignal.encode(values, self.protocol, self.sent_samples)
+
+                self.sent_samples += len(values)
+
+            try:
+
+                while self.pending and self.running:
+
+                    written = os.write(self.master, self.pending)
+                    self.pending = self.pending[written:]
+
+            except BlockingIOError:
+
+                pass
+
+            except OSError:
+
+                break
+
+            if self.finished and not self.pending:
+
+                break
+
+            time.sleep(self.interval)
+
+class VirtualSerialSource(PtySource):
+
+    def __init__(self, rate = 1000, seed = 0, interval = 0.002, protocol = "csv", **noise):
+
+        super().__init__(interval, protocol = protocol)
+
+        self.signal = SyntheticSignal(rate, seed, **noise)
+
+    def produce(self, elapsed):
+
+        due = int(elapsed * self.signal.rate) - self.signal.generated
+
+        return self.signal.generate(max(due, 0))
+
+class ReplaySource(PtySource):
+
+    def __init__(self, path, speed = 1.0, interval = 0.002, protocol = "csv"):
+
+        super().__init__(interval, drop_when_full = speed is not None, protocol = protocol)
+
+        data = SessionFormat.load(path)
+        self.times = data.column(0) - data.column(0)[0] if len(data) else np.empty(0)
+        self.values = np.column_stack([data.column(i) for i in range(1, 4)]).astype(float)
+        self.speed = speed
+        self.position = 0
+
+    def produce(self, elapsed):
+
+        if self.speed is None:
+
+            end = min(self.position + 4096, len(self.values))
+
+        else:
+
+            end = int(np.searchsorted(self.times, elapsed * self.speed, side = "right"))
+
+        chunk = self.values[self.position:end]
+        self.position = max(self.position, end)
+        self.finished = self.position >= len(self.values)
+
+        return chunk
+
+class SessionWriter:
+
+    open_writers = set()
+
+    def __init__(self, path, columns, formatter = None, attrs = None, export_csv = False, csv_encoding = None,
+                 flush_interval = 0.5, sync_interval = 2.0, live_attrs = None):
+
+        self.path = path
+        self.partial_path = path + ".partial"
+        self.columns = columns
+        self.dtype = SessionFormat.dtype(columns)
+        self.formatter = formatter or (lambda rows: np.array([tuple(row) for row in rows], dtype = self.dtype))
+        self.attrs = dict(attrs or {})
+        self.live_attrs = live_attrs
+        self.export_csv = export_csv
+        self.csv_encoding = csv_encoding
+        self.flush_interval = flush_interval
+        self.sync_interval = sync_interval
+        self.queue = queue.Queue()
+        self.rows_written = 0
+        self.file = SessionFormat.open(self.partial_path, columns, self.attrs)
+        self.thread = threading.Thread(target = self.write_loop, daemon = True)
+        self.thread.start()
+
+        SessionWriter.open_writers.add(self)
+
+    def write(self, item):
+
+        self.queue.put(item)
+
+    def write_loop(self):
+
+        last_sync = time.monotonic()
+        running = True
+
+        while running:
+
+            items = []
+
+            try:
+
+                items.append(self.queue.get(timeout = self.flush_interval))
+
+                while True:
+
+                    items.append(self.queue.get_nowait())
+
+            except queue.Empty:
+
+                pass
+
+            for item in items:
+
+                if item is None:
+
+                    running = False
+
+                    break
+
+                records = self.formatter(item)
+                self.file.write(records.tobytes())
+                self.rows_written += len(records)
+
+            self.file.flush()
+
+            if time.monotonic() - last_sync >= self.sync_interval:
+
+                if self.live_attrs is not None:
+
+                    self.attrs.update(self.live_attrs())
+                    SessionFormat.update_attrs(self.file, self.columns, self.attrs)
+
+                os.fsync(self.file.fileno())
+                last_sync = time.monotonic()
+
+    def close(self, attrs = None):
+
+        if self not in SessionWriter.open_writers:
+
+            return
+
+        SessionWriter.open_writers.discard(self)
+
+        self.queue.put(None)
+        self.thread.join()
+        self.attrs.update(attrs or {})
+        SessionFormat.update_attrs(self.file, self.columns, self.attrs)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+        os.replace(self.partial_path, self.path)
+
+        if self.export_csv:
+
+            SessionFormat.to_csv(self.path, encoding = self.csv_encoding)
+
+    @classmethod
+    def close_all(cls):
+
+        for writer in list(cls.open_writers):
+
+            writer.close()
+
+    @staticmethod
+    def discard(partial_path, path, error):
+
+        try:
+
+            if os.path.getsize(partial_path):
+
+                os.replace(partial_path, path + ".corrupt")
+                print(f"Arquivo de sessão interrompida ilegível ({error}), mantido como {path}.corrupt")
+
+            else:
+
+                os.remove(partial_path)
+                print(f"Arquivo de sessão interrompida vazio descartado: {partial_path}")
+
+        except OSError as e:
+
+            print(f"Não foi possível descartar {partial_path}: {e}")
+
+    @staticmethod
+    def repair(folder):
+
+        repaired = []
+
+        if not os.path.isdir(folder):
+
+            return repaired
+
+        for name in sorted(os.listdir(folder)):
+
+            if not name.endswith(".partial"):
+
+                continue
+
+            partial_path = os.path.join(folder, name)
+            path = partial_path[:-len(".partial")]
+
+            try:
+
+                if path.endswith(SessionFormat.EXTENSION):
+
+                    SessionFormat.repair(partial_path)
+
+                else:
+
+                    with open(partial_path, mode = "rb+") as file:
+
+                        data = file.read()
+                        file.truncate(data.rfind(b"\n") + 1)
+
+                os.replace(partial_path, path)
+
+            except (OSError, ValueError) as e:
+
+                SessionWriter.discard(partial_path, path, e)
+
+                continue
+
+            repaired.append(path)
+
+        return repaired
+
+class DataCollector:
+
+    SENSOR_COLUMNS = [{"name": "Tempo (s)", "format": "<i8", "csv": "{:.4f}", "rate": "sample_rate"},
+                      {"name": "Eletromiografia (μV)", "format": "<f4", "csv": "{:.2f}"},
+                      {"name": "Força no Antebraço (N)", "format": "<f4", "csv": "{:.2f}"},
+                      {"name": "Força no Dedo (N)", "format": "<f4", "csv": "{:.2f}"}]
+    SENSOR_HEADER = [column["name"] for column in SENSOR_COLUMNS]
+
+    def __init__(self, port = "COM5", baud_rate = 9600, output_folder = "Results", buffer_capacity = 65536,
+                 reader_mode = "batch", chunk_size = 4096, read_timeout = 0.05, sample_rate = 1000, profiler = None,
+                 source = None, protocol = "csv"):
+
+        self.port = port
+        self.baud_rate = baud_rate
+        self.source = SerialSource(port, baud_rate) if source is None else source
+        self.buffer = SampleBuffer(5, buffer_capacity)
+        self.emg_filter = StreamingFilter(fs = sample_rate)
+        self.sample_clock = SampleClock(sample_rate)
+        self.reader_mode = reader_mode
+        self.chunk_size = chunk_size
+        self.read_timeout = read_timeout
+        self.protocol = protocol
+        self.parser = FrameDecoder() if protocol == "binary" else LineParser()
+        self.ser = None
+        self.reader_thread = None
+        self.session_writer = None
+        self.profiler = profiler
+        self.collecting = False
+        self.output_folder = output_folder
+        self.create_output_folder()
+
+    @property
+    def sample_indices(self):
+
+        return self.buffer.channel(0)
+
+    @property
+    def time_stamps(self):
+
+        return self.sample_clock.times(self.sample_indices) if len(self.buffer) else np.empty(0)
+
+    @property
+    def emg_data(self):
+
+        return self.buffer.channel(1)
+
+    @property
+    def fsr1_data(self):
+
+        return self.buffer.channel(2)
+
+    @property
+    def fsr2_data(self):
+
+        return self.buffer.channel(3)
+
+    @property
+    def emg_filtered(self):
+
+        return self.buffer.channel(4)
+
+    @property
+    def sample_rate(self):
+
+        return self.sample_clock.rate
+
+    def create_output_folder(self):
+
+        if not os.path.exists(self.output_folder):
+
+            os.makedirs(self.output_folder)
+
+    def start_collection(self):
+
+        if self.ser is None or not self.ser.is_open:
+
+            try:
+
+                batch_mode = self.reader_mode == "batch" or self.protocol == "binary"
+                self.ser = self.source.open(self.read_timeout if batch_mode else 1)
+
+                time.sleep(self.source.settle_time)
+
+                self.collecting = True
+
+                self.reader_thread = threading.Thread(target = self.read_data_batched if batch_mode else self.read_data, daemon = True)
+                self.reader_thread.start()
+
+                print("Coleta de dados iniciada.")
+
+            except serial.SerialException as e:
+
+                print(f"Erro ao conectar ao dispositivo serial: {e}")
+
+    def stop_collection(self):
+
+        self.collecting = False
+
+        if self.reader_thread is not None:
+
+            self.reader_thread.join(timeout = 2)
+            self.reader_thread = None
+
+        if self.ser and self.ser.is_open:
+
+            self.ser.close()
+            self.source.close()
+
+            print("Conexão serial encerrada.")
+            print(f"Taxa de amostragem estimada: {self.sample_rate:.1f} Hz")
+
+            report = self.parser.report()
+
+            if report:
+
+                print(report)
+
+        if self.session_writer is not None:
+
+            self.session_writer.close({"sample_rate": self.sample_rate, "samples": len(self.buffer)})
+            self.session_writer = None
+
+    def read_data(self):
+
+        try:
+
+            while self.collecting:
+
+                if self.ser.in_waiting > 0:
+
+                    line = self.ser.readline().decode("utf-8").strip()
+
+                    try:
+
+                        emg_str, fsr1_str, fsr2_str = line.split(",")
+
+                        emg_value = float(emg_str)
+                        fsr1_value = float(fsr1_str)
+                        fsr2_value = float(fsr2_str)
+
+                    except ValueError:
+
+                        continue
+
+                    self.store_batch(np.array([[emg_value, fsr1_value, fsr2_value]]), time.time())
+
+                time.sleep(0.1)
+
+        except serial.SerialException:
+
+            print("Erro na comunicação com o dispositivo serial.")
+
+        except Exception as e:
+
+            print(f"Erro inesperado na coleta de dados: {e!r}")
+
+    def read_data_batched(self):
+
+        try:
+
+            while self.collecting:
+
+                waiting = self.ser.in_waiting
+                chunk = self.ser.read(waiting or self.chunk_size)
+
+                if not chunk:
+
+                    continue
+
+                values = self.parser.feed(chunk)
+
+                if len(values):
+
+                    self.store_batch(values, time.time())
+
+                if self.profiler is not None:
+
+                    self.profiler.record("serial_queue_bytes", waiting)
+                    self.profiler.record("serial_batch_samples", len(values))
+                    self.profiler.record_rate("serial_samples_per_s", len(values))
+
+        except serial.SerialException:
+
+            print("Erro na comunicação com o dispositivo serial.")
+
+        except Exception as e:
+
+            print(f"Erro inesperado na coleta de dados: {e!r}")
+
+    def store_batch(self, values, arrival):
+
+        indices = self.sample_clock.observe(len(values), arrival, self.parser.indices if self.protocol == "binary" else None)
+
+        self.emg_filter.retune(self.sample_rate)
+        emg_filtered = self.emg_filter.process(values[:, 0])
+
+        self.buffer.extend(np.vstack((indices, values.T, emg_filtered)))
+
+        if self.session_writer is not None:
+
+            self.session_writer.write(np.column_stack((indices, values)))
+
+    def record_to(self, name = "sensor_data", export_csv = False):
+
+        self.session_writer = SessionWriter(os.path.join(self.output_folder, name + SessionFormat.EXTENSION), self.SENSOR_COLUMNS,
+                                            self.format_sensor_records,
+                                            attrs = {"sample_rate": self.sample_rate, "protocol": self.protocol, "start_time": time.time()},
+                                            export_csv = export_csv,
+                                            csv_encoding = "utf-8",
+                                            live_attrs = lambda: {"sample_rate": self.sample_rate})
+
+    def format_sensor_records(self, block):
+
+        records = np.empty(len(block), dtype = self.session_writer.dtype)
+        names = self.session_writer.dtype.names
+        records[names[0]] = np.rint(block[:, 0])
+
+        for i, name in enumerate(names[1:], start = 1):
+
+            records[name] = block[:, i]
+
+        return records
+
+    def apply_bandpass_filter(self, data, lowcut = 20, highcut = 500, fs = None, order = 4):
+
+        sos = StreamingFilter.design(lowcut, highcut, fs or round(self.sample_rate, 1), order)
+
+        if sos is None:
+
+            return np.asarray(data, dtype = float)
+
+        return sosfiltfilt(sos, data)
+
+    def apply_moving_average(self, data, window_size = 5):
+
+        return np.convolve(data, np.ones(window_size) / window_size, mode = 'same')
+
+    def process_data(self):
+
+        if len(self.buffer):
+
+            data = self.buffer.view()
+            data[4] = self.finalize_filter()
+            data[3] = self.apply_moving_average(data[3])
+
+    def finalize_filter(self):
+
+        return self.emg_filter.finalize(self.emg_data)
+
+    def save_sensor_data_to_csv(self, filename = "sensor_data.csv"):
+
+        if not len(self.buffer):
+
+            return
+
+        data = self.buffer.view()
+        csv_path = os.path.join(self.output_folder, filename)
+
+        with open(csv_path, mode = "w", newline = "", encoding = "utf-8") as file:
+
+            writer = csv.writer(file)
+            writer.writerow(self.SENSOR_HEADER)
+            relative_time = (data[0] - data[0, 0]) / self.sample_rate
+            digits = max(2, math.ceil(math.log10(self.sample_rate)))
+
+            for t, emg, fsr1, fsr2 in zip(relative_time.tolist(), data[1].tolist(), data[2].tolist(), data[3].tolist()):
+
+                writer.writerow([f"{t:.{digits}f}", f"{emg:.2f}", f"{fsr1:.2f}", f"{fsr2:.2f}"])
+
+class AccuracyEngine:
+
+    def __init__(self, target_pixels, tolerance = 5):
+
+        target = np.asarray(target_pixels, dtype = int).reshape(-1, 2)
+
+        self.tolerance = tolerance
+        self.empty = not len(target)
+
+        if self.empty:
+
+            self.origin = np.zeros(2, dtype = int)
+            self.mask = np.zeros((0, 0), dtype = bool)
+
+            return
+
+        self.origin = target.min(axis = 0) - tolerance
+        shape = target.max(axis = 0) - self.origin + tolerance + 1
+        mask = np.zeros(shape, dtype = bool)
+        mask[target[:, 0] - self.origin[0], target[:, 1] - self.origin[1]] = True
+
+        self.mask = maximum_filter(mask, size = 2 * tolerance + 1, mode = "constant")
+
+    def hits(self, pixels):
+
+        local = np.asarray(pixels, dtype = int).reshape(-1, 2) - self.origin
+        inside = (local >= 0).all(axis = 1) & (local < self.mask.shape).all(axis = 1)
+        result = np.zeros(len(local), dtype = bool)
+        result[inside] = self.mask[local[inside, 0], local[inside, 1]]
+
+        return result
+
+class LiveAccuracy:
+
+    def __init__(self, engine, key, width = Config.SCREEN_WIDTH, height = Config.SCREEN_HEIGHT):
+
+        self.engine = engine
+        self.key = key
+        self.width = width
+        self.height = height
+        self.visited = np.zeros(width * height, dtype = bool)
+        self.outside = set()
+        self.points = 0
+        self.hits = 0
+        self.total = 0
+
+    @property
+    def accuracy(self):
+
+        return (self.hits / self.total) * 100 if self.total else 0
+
+    def add(self, points, consumed):
+
+        self.points += consumed
+        pixels = Utils.rasterize_polyline(points)
+
+        if not len(pixels):
+
+            return
+
+        inside = ((pixels >= 0) & (pixels < (self.width, self.height))).all(axis = 1)
+
+        if not inside.all():
+
+            outside = {pixel for pixel in map(tuple, pixels[~inside].tolist()) if pixel not in self.outside}
+            self.outside.update(outside)
+            self.count(np.array(sorted(outside), dtype = np.int64).reshape(-1, 2))
+            pixels = pixels[inside]
+
+        flat = np.unique(pixels[:, 0] * self.height + pixels[:, 1])
+        flat = flat[~self.visited[flat]]
+        self.visited[flat] = True
+
+        self.count(np.column_stack((flat // self.height, flat % self.height)))
+
+    def count(self, pixels):
+
+        if len(pixels):
+
+            self.hits += int(self.engine.hits(pixels).sum())
+            self.total += len(pixels)
+
+class PhaseOne:
+
+    COLUMNS = [{"name": "Interação", "format": "<i4", "csv": "{}"},
+               {"name": "Tempo (s)", "format": "<f8", "csv": "{:.2f}"},
+               {"name": "Cliques", "format": "<i4", "csv": "{}"},
+               {"name": "Precisão (%)", "format": "<f8", "csv": "{:.2f}"}]
+
+    def __init__(self, output_folder = "Results", profiler = None, clock = time.time):
+
+        super().__init__()
+
+        self.clock = clock
+        self.profiler = profiler
+        self.clicks = 0
+        self.points = 0
+        self.clicks_to_hit = 0
+        self.max_time = 10
+        self.phase_goal = 100
+        self.start_time = self.clock()
+        self.target = self.create_target()
+        self.last_target_time = self.clock()
+        self.target_creation_time = self.clock()
+        self.target_data = []
+        self.output_folder = output_folder
+        self.session_writer = None
+
+    def dashboard_lines(self):
+
+        elapsed_time = self.clock() - self.start_time
+
+        return [(f"Tempo: {int(elapsed_time)} segundos", (10, 10)),
+                (f"Cliques: {self.clicks}", (10, 50)),
+                (f"Pontos: {self.points} / {self.phase_goal}", (10, 90))]
+
+    def display_dashboard(self, screen, font):
+
+        for text, position in self.dashboard_lines():
+
+            Utils.draw_text(screen, text, position, font, Config.COLORS["BLACK"])
+
+    def calculate_statistics(self):
+
+        if not self.target_data:
+
+            return {k: 0 for k in ("time_mean", "time_stdev", "clicks_mean", "clicks_stdev", "precision_mean", "precision_stdev")}
+
+        times = [d["time"] for d in self.target_data]
+        clicks = [d["clicks"] for d in self.target_data]
+        precisions = [d["precision"] for d in self.target_data]
+
+        return {"time_mean": statistics.mean(times),
+                "time_stdev": statistics.stdev(times) if len(times) > 1 else 0,
+                "clicks_mean": statistics.mean(clicks),
+                "clicks_stdev": statistics.stdev(clicks) if len(clicks) > 1 else 0,
+                "precision_mean": statistics.mean(precisions),
+                "precision_stdev": statistics.stdev(precisions) if len(precisions) > 1 else 0}
+
+    def create_target(self):
+
+        return (random.randint(50, Config.SCREEN_WIDTH - 110),
+                random.randint(50, Config.SCREEN_HEIGHT - 110),
+                random.randint(10, 110))
+
+    def update_target(self):
+
+        self.clicks_to_hit = 0
+        self.target = self.create_target()
+        self.last_target_time = self.clock()
+        self.target_creation_time = self.clock()
+
+    def check_target_timeout(self):
+
+        if self.clock() - self.last_target_time > self.max_time:
+
+            self.target = self.create_target()
+            self.last_target_time = self.clock()
+
+    def handle_click(self, mouse_pos):
+
+        start = time.perf_counter() if self.profiler is not None else None
+
+        self.clicks += 1
+        self.clicks_to_hit += 1
+
+        distance = Utils.calculate_distance(mouse_pos, (self.target[0], self.target[1]))
+
+        if distance <= self.target[2]:
+
+            self.points += self.calculate_score(distance)
+
+            time_to_hit = self.clock() - self.last_target_time
+            precision = Utils.calculate_precision(distance, self.target[2])
+            self.target_data.append({"time": time_to_hit,
+                                     "clicks": self.clicks_to_hit,
+                                     "precision": precision})
+
+            if self.session_writer is not None:
+
+                self.session_writer.write([(len(self.target_data), time_to_hit, self.clicks_to_hit, precision)])
+
+            self.update_target()
+
+        if start is not None:
+
+            self.profiler.record("phase_one_click", time.perf_counter() - start)
+
+    def calculate_score(self, distance):
+
+        if self.target[2] <= 30:
+
+            section_scores = [9, 10, 11, 12, 13]
+
+        elif self.target[2] <= 50:
+
+            section_scores = [7, 8, 9, 10, 11]
+
+        elif self.target[2] <= 70:
+
+            section_scores = [5, 6, 7, 8, 9]
+
+        elif self.target[2] <= 90:
+
+            section_scores = [3, 4, 5, 6, 7]
+
+        else:
+
+            section_scores = [1, 2, 3, 4, 5]
+
+        if distance <= self.target[2] * (1 / 5):
+
+            return section_scores[4]
+
+        elif distance <= self.target[2] * (2 / 5):
+
+            return section_scores[3]
+
+        elif distance <= self.target[2] * (3 / 5):
+
+            return section_scores[2]
+
+        elif distance <= self.target[2] * (4 / 5):
+
+            return section_scores[1]
+
+        else:
+
+            return section_scores[0]
+
+    def record_to(self, name = "phase_one", export_csv = False):
+
+        self.session_writer = SessionWriter(os.path.join(self.output_folder, name + SessionFormat.EXTENSION), self.COLUMNS,
+                                            export_csv = export_csv)
+
+    def close_writer(self):
+
+        if self.session_writer is not None:
+
+            self.session_writer.close()
+            self.session_writer = None
+
+    def save_statistics_to_csv(self, filename = "phase_one.csv"):
+
+        if not self.target_data:
+
+            return
+
+        csv_path = os.path.join(self.output_folder, filename)
+
+        with open(csv_path, mode = "w", newline = "") as file:
+
+            writer = csv.writer(file)
+            writer.writerow([column["name"] for column in self.COLUMNS])
+
+            for i, d in enumerate(self.target_data, start = 1):
+
+                writer.writerow([i, f"{d['time']:.2f}", d["clicks"], f"{d['precision']:.2f}"])
+
+class PhaseTwo: 
+
+    COLUMNS = [{"name": "Nível", "format": "<i4", "csv": "{}"},
+               {"name": "Tempo (s)", "format": "<f8", "csv": "{:.2f}"},
+               {"name": "Precisão (%)", "format": "<f8", "csv": "{:.2f}"}]
+
+    def __init__(self, output_folder = "Results", profiler = None, clock = time.time):
+
+        super().__init__()
+
+        self.clock = clock
+        self.profiler = profiler
+        self.level = 0
+        self.total_levels = 3
+        self.checkpoints = self.generate_checkpoints()
+        self.current_checkpoints = self.checkpoints.copy()
+        self.checkpoint_status = [False] * len(self.checkpoints)
+        self.checkpoint_radius = 10
+        self.next_checkpoint = 0
+        self.user_line = []
+        self.draw_data = []
+        self.start_time = None
+        self.user_active = False
+        self.output_folder = output_folder
+        self.session_writer = None
+        self.accuracy_engine = None
+        self.live_accuracy = None
+
+    def dashboard_lines(self):
+
+        elapsed_time = 0 if self.start_time is None else self.clock() - self.start_time
+        live_precision = 0 if self.live_accuracy is None else self.live_accuracy.accuracy
+
+        return [(f"Tempo: {int(elapsed_time)} segundos", (10, 10)),
+                (f"Checkpoints: {self.checkpoint_status.count(True)} / {len(self.checkpoints)}", (10, 50)),
+                (f"Precisão: {live_precision:.1f}%", (10, 90))]
+
+    def display_dashboard(self, screen, font):
+
+        for text, position in self.dashboard_lines():
+
+            Utils.draw_text(screen, text, position, font, Config.COLORS["BLACK"])
+
+    def calculate_statistics(self):
+
+        if not self.draw_data:
+
+            return {k: 0 for k in ("time_mean", "time_stdev", "precision_mean", "precision_stdev")}
+
+        times = [d["time"] for d in self.draw_data]
+        precisions = [d["precision"] for d in self.draw_data]
+
+        return {"time_mean": statistics.mean(times),
+                "time_stdev": statistics.stdev(times) if len(times) > 1 else 0,
+                "precision_mean": statistics.mean(precisions),
+                "precision_stdev": statistics.stdev(precisions) if len(precisions) > 1 else 0}
+
+    def handle_event(self, event):
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+
+            self.user_active, self.user_line = True, [event.pos]
+            self.start_time = self.clock()
+            self.live_accuracy = self.create_live_accuracy()
+
+        elif event.type == pygame.MOUSEMOTION:
+
+            self.handle_motion([event.pos])
+
+        elif event.type == pygame.MOUSEBUTTONUP and self.user_active:
+
+            self.advance_level()
+
+            self.user_line, self.start_time, self.user_active = [], None, False
+            self.live_accuracy = None
+
+    def handle_motion(self, positions):
+
+        if not self.user_active or not positions:
+
+            return
+
+        start = time.perf_counter() if self.profiler is not None else None
+
+        self.user_line.extend(positions)
+
+        stroke = self.user_line[-(len(positions) + 1):]
+        self.live_accuracy.add(stroke, len(positions))
+        self.update_checkpoints(np.asarray(stroke, dtype = float))
+
+        if start is not None:
+
+            self.profiler.record("phase_two_motion", time.perf_counter() - start)
+
+    def update_checkpoints(self, stroke):
+
+        starts, ends = stroke[:-1].copy(), stroke[1:]
+        first = 0
+
+        while self.next_checkpoint < len(self.checkpoints):
+
+            distances, closest = Utils.segment_closest_points(starts[first:], ends[first:], self.checkpoints[self.next_checkpoint])
+            hits = np.flatnonzero(distances <= self.checkpoint_radius)
+
+            if not len(hits):
+
+                break
+
+            self.checkpoint_status[self.next_checkpoint] = True
+            self.next_checkpoint += 1
+            first += hits[0]
+            starts[first] = closest[hits[0]]
+
+    def advance_level(self):
+
+        if self.level >= self.total_levels:
+
+            return False
+
+        if all(self.checkpoint_status):
+
+            self.level += 1
+            self.current_checkpoints = self.checkpoints.copy()
+
+            elapsed_time = self.clock() - self.start_time
+            start = time.perf_counter() if self.profiler is not None else None
+            accuracy = self.calculate_accuracy()
+
+            if start is not None:
+
+                self.profiler.record("phase_two_accuracy", time.perf_counter() - start)
+
+            self.draw_data.append({"time": elapsed_time,
+                                   "precision": accuracy})
+
+            if self.session_writer is not None:
+
+                self.session_writer.write([(self.level, elapsed_time, accuracy)])
+
+            if self.level == self.total_levels:
+
+                return False
+
+            self.checkpoints = self.generate_checkpoints()
+            self.checkpoint_status = [False] * len(self.checkpoints)
+            self.next_checkpoint = 0
+
+            if self.user_active:
+
+                self.live_accuracy = self.create_live_accuracy()
+
+        return True
+
+    def generate_checkpoints(self, num_checkpoints = 5):
+
+        return [(random.randint(100, Config.SCREEN_WIDTH - 100),
+                 random.randint(100, Config.SCREEN_HEIGHT - 100)) for _ in range(num_checkpoints)]
+
+    def rasterize_line(self, start, end):
+
+        return [tuple(pixel) for pixel in Utils.rasterize_polyline((start, end)).tolist()]
+
+    def calculate_accuracy(self, tolerance = 5):
+
+        if not self.user_line or not self.current_checkpoints:
+
+            return 0
+
+        live = self.live_accuracy
+
+        if (live is not None and live.points == len(self.user_line)
+            and live.key == (tuple(self.current_checkpoints), tolerance)):
+
+            return live.accuracy
+
+        user_pixels = Utils.rasterize_polyline(self.user_line, deduplicate = True)
+        engine = self.get_accuracy_engine(tolerance)
+
+        if engine.empty or len(user_pixels) == 0:
+
+            return 0
+
+        hits = int(engine.hits(user_pixels).sum())
+
+        return (hits / len(user_pixels)) * 100
+
+    def get_accuracy_engine(self, tolerance = 5, checkpoints = None):
+
+        checkpoints = self.current_checkpoints if checkpoints is None else checkpoints
+        key = (tuple(checkpoints), tolerance)
+
+        if self.accuracy_engine is None or self.accuracy_engine[0] != key:
+
+            target_pixels = Utils.rasterize_polyline(checkpoints)
+            self.accuracy_engine = (key, AccuracyEngine(target_pixels, tolerance))
+
+        return self.accuracy_engine[1]
+
+    def create_live_accuracy(self, tolerance = 5):
+
+        engine = self.get_accuracy_engine(tolerance, self.checkpoints)
+        live = LiveAccuracy(engine, (tuple(self.checkpoints), tolerance))
+        live.add(self.user_line, len(self.user_line))
+
+        return live
+
+    def record_to(self, name = "phase_two", export_csv = False):
+
+        self.session_writer = SessionWriter(os.path.join(self.output_folder, name + SessionFormat.EXTENSION), self.COLUMNS,
+                                            export_csv = export_csv)
+
+    def close_writer(self):
+
+        if self.session_writer is not None:
+
+            self.session_writer.close()
+            self.session_writer = None
+
+    def save_statistics_to_csv(self, filename = "phase_two.csv"):
+
+        if not self.draw_data:
+
+            return
+
+        csv_path = os.path.join(self.output_folder, filename)
+
+        with open(csv_path, mode = "w", newline = "") as file:
+
+            writer = csv.writer(file)
+            writer.writerow([column["name"] for column in self.COLUMNS])
+
+            for i, d in enumerate(self.draw_data, start = 1):
+
+                writer.writerow([i, f"{d['time']:.2f}", f"{d['precision']:.2f}"])
+
+class SimulatedClock:
+
+    def __init__(self, start = 0.0):
+
+        self.now = start
+
+    def __call__(self):
+
+        return self.now
+
+    def advance(self, seconds):
+
+        self.now += seconds
+
+class ClickBot:
+
+    def __init__(self, rng, click_probability = 0.25, spread = 0.4):
+
+        self.rng = rng
+        self.click_probability = click_probability
+        self.spread = spread
+
+    def events(self, phase_one):
+
+        if self.rng.random() >= self.click_probability:
+
+            return []
+
+        x, y, radius = phase_one.target
+        position = (int(x + self.rng.gauss(0, self.spread * radius)), int(y + self.rng.gauss(0, self.spread * radius)))
+
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos = position, button = 1)]
+
+class TraceBot:
+
+    def __init__(self, rng, speed = 12, events_per_frame = 4, noise = 1.5):
+
+        self.rng = rng
+        self.speed = speed
+        self.events_per_frame = events_per_frame
+        self.noise = noise
+        self.checkpoints = None
+        self.stroke = []
+        self.index = 0
+        self.drawing = False
+
+    def plan(self, checkpoints):
+
+        spacing = self.speed / self.events_per_frame
+        stroke = []
+
+        for (x1, y1), (x2, y2) in zip(checkpoints, checkpoints[1:]):
+
+            steps = max(1, int(math.hypot(x2 - x1, y2 - y1) / spacing))
+
+            for step in range(steps):
+
+                t = step / steps
+                stroke.append((int(x1 + (x2 - x1) * t + self.rng.gauss(0, self.noise)),
+                               int(y1 + (y2 - y1) * t + self.rng.gauss(0, self.noise))))
+
+        stroke.append(tuple(checkpoints[-1]))
+
+        self.stroke = stroke
+        self.index = 0
+
+    def release(self):
+
+        self.drawing = False
+
+        return pygame.event.Event(pygame.MOUSEBUTTONUP, pos = self.stroke[self.index - 1], button = 1)
+
+    def events(self, phase_two):
+
+        if phase_two.checkpoints is not self.checkpoints:
+
+            events = [self.release()] if self.drawing else []
+            self.checkpoints = phase_two.checkpoints
+            self.plan(self.checkpoints)
+
+            return events
+
+        if not self.drawing:
+
+            self.drawing = True
+            self.index = 1
+
+            return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos = self.stroke[0], button = 1)]
+
+        chunk = self.stroke[self.index:self.index + self.events_per_frame]
+        self.index += len(chunk)
+        events = [pygame.event.Event(pygame.MOUSEMOTION, pos = point, rel = (0, 0), buttons = (1, 0, 0)) for point in chunk]
+
+        if self.index >= len(self.stroke):
+
+            events.append(self.release())
+            self.plan(self.checkpoints)
+
+        return events
+
+class Renderer:
+
+    def __init__(self, screen, font):
+
+        self.screen = screen
+        self.font = font
+        self.background = pygame.Surface(screen.get_size())
+        self.stroke_layer = pygame.Surface(screen.get_size())
+        self.stroke_layer.set_colorkey(Config.COLORS["WHITE"])
+        self.stroke_bounds = None
+        self.text_surfaces = {}
+        self.sprite_surfaces = {}
+        self.sprites = {}
+        self.presented = {}
+        self.damage = []
+        self.full_redraw = True
+
+    def render_text(self, text, color = Config.COLORS["BLACK"]):
+
+        key = (text, color)
+        surface = self.text_surfaces.get(key)
+
+        if surface is None:
+
+            if len(self.text_surfaces) >= 256:
+
+                self.text_surfaces.clear()
+
+            surface = self.text_surfaces[key] = self.font.render(text, True, color)
+
+        return surface
+
+    def target_sprite(self, radius):
+
+        key = ("target", radius)
+
+        if key not in self.sprite_surfaces:
+
+            surface = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            center = (radius, radius)
+
+            pygame.draw.circle(surface, Config.COLORS["RED"], center, radius)
+            pygame.draw.circle(surface, Config.COLORS["WHITE"], center, int(radius * (4 / 5)))
+            pygame.draw.circle(surface, Config.COLORS["RED"], center, int(radius * (3 / 5)))
+            pygame.draw.circle(surface, Config.COLORS["WHITE"], center, int(radius * (2 / 5)))
+            pygame.draw.circle(surface, Config.COLORS["BLACK"], center, int(radius * (1 / 5)))
+
+            self.sprite_surfaces[key] = surface
+
+        return self.sprite_surfaces[key]
+
+    def checkpoint_sprite(self, index, reached, radius = 10):
+
+        key = ("checkpoint", index, reached, radius)
+
+        if key not in self.sprite_surfaces:
+
+            label = self.render_text(str(index + 1))
+            size = (max(2 * radius + 1, label.get_width()), max(2 * radius + 1, label.get_height()))
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+
+            pygame.draw.circle(surface, Config.COLORS["GREEN"] if reached else Config.COLORS["RED"], (radius, radius), radius)
+            surface.blit(label, (0, 0))
+
+            self.sprite_surfaces[key] = surface
+
+        return self.sprite_surfaces[key]
+
+    def begin_scene(self):
+
+        self.sprites.clear()
+        self.presented.clear()
+        self.damage.clear()
+        self.background.fill(Config.COLORS["WHITE"])
+        self.stroke_layer.fill(Config.COLORS["WHITE"])
+        self.stroke_bounds = None
+        self.full_redraw = True
+
+    def set_background(self, draw):
+
+        self.background.fill(Config.COLORS["WHITE"])
+        draw(self.background)
+        self.full_redraw = True
+
+    def place(self, slot, surface, position):
+
+        self.sprites[slot] = (surface, surface.get_rect(topleft = position))
+
+    def text(self, slot, text, position, color = Config.COLORS["BLACK"]):
+
+        self.place(slot, self.render_text(text, color), position)
+
+    def draw_stroke(self, points, color, width):
+
+        if len(points) > 1:
+
+            rect = pygame.draw.lines(self.stroke_layer, color, False, points, width)
+            self.stroke_bounds = rect if self.stroke_bounds is None else self.stroke_bounds.union(rect)
+            self.damage.append(rect)
+
+    def clear_stroke(self):
+
+        if self.stroke_bounds is not None:
+
+            self.stroke_layer.fill(Config.COLORS["WHITE"], self.stroke_bounds)
+            self.damage.append(self.stroke_bounds)
+            self.stroke_bounds = None
+
+    def remove(self, slot):
+
+        self.sprites.pop(slot, None)
+
+    def present(self):
+
+        self.flip(self.compose())
+
+    def compose(self):
+
+        if self.full_redraw:
+
+            self.screen.blit(self.background, (0, 0))
+            self.screen.blit(self.stroke_layer, (0, 0))
+
+            for surface, rect in self.sprites.values():
+
+                self.screen.blit(surface, rect)
+
+            self.presented = dict(self.sprites)
+            self.damage = []
+            self.full_redraw = False
+
+            return None
+
+        for slot, (surface, rect) in self.sprites.items():
+
+            previous = self.presented.get(slot)
+
+            if previous is None or previous[0] is not surface or previous[1] != rect:
+
+                if previous is not None:
+
+                    self.damage.append(previous[1])
+
+                self.damage.append(rect)
+
+        for slot in self.presented.keys() - self.sprites.keys():
+
+            self.damage.append(self.presented[slot][1])
+
+        if not self.damage:
+
+            return []
+
+        for rect in self.damage:
+
+            self.screen.set_clip(rect)
+            self.screen.blit(self.background, rect, rect)
+            self.screen.blit(self.stroke_layer, rect, rect)
+
+            for surface, sprite_rect in self.sprites.values():
+
+                if sprite_rect.colliderect(rect):
+
+                    self.screen.blit(surface, sprite_rect)
+
+        self.screen.set_clip(None)
+
+        rects, self.damage = self.damage, []
+        self.presented = dict(self.sprites)
+
+        return rects
+
+    def flip(self, rects):
+
+        if rects is None:
+
+            pygame.display.flip()
+
+        elif rects:
+
+            pygame.display.update(rects)
+
+class Game:
+
+    def __init__(self, profile = False, headless = False, seed = None, output_folder = "Results", sample_rate = 1000,
+                 source_factory = None, protocol = "csv", export_csv = False, patient = None, bot_factories = None):
+
+        if headless:
+
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        pygame.init()
+        pygame.display.set_caption("Jogo de Precisão")
+
+        self.font = pygame.font.Font(None, 36)
+        self.clock = pygame.time.Clock()
+        self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+        self.renderer = Renderer(self.screen, self.font)
+        self.profiler = Profiler() if profile else None
+        self.show_profiler = False
+        self.catalog = SessionCatalog(output_folder)
+        self.recover_sessions()
+        self.session_id = self.catalog.create_session(patient)
+        self.session_open = True
+        self.output_folder = self.catalog.path(self.session_id)
+        self.headless = headless
+        self.export_csv = export_csv
+        self.frames = 0
+
+        collector_options = {"output_folder": self.output_folder, "profiler": self.profiler, "sample_rate": sample_rate, "protocol": protocol}
+
+        if headless:
+
+            rng = random.Random(seed)
+            self.game_clock = SimulatedClock()
+
+            if bot_factories is None:
+
+                bot_factories = {"phase_one": ClickBot, "phase_two": TraceBot}
+
+            self.bots = {phase: factory(rng) for phase, factory in bot_factories.items()}
+
+            if source_factory is None:
+
+                source_factory = lambda: SyntheticSource(sample_rate, seed, protocol)
+
+        else:
+
+            self.game_clock = time.time
+            self.bots = {}
+
+        source_factory = source_factory or (lambda: None)
+
+        self.phase_one_complete = False
+        self.data_collector_one = DataCollector(source = source_factory(), **collector_options)
+        self.phase_two_complete = False
+        self.data_collector_two = DataCollector(source = source_factory(), **collector_options)
+
+    def recover_sessions(self):
+
+        for session_id in self.catalog.unfinished_sessions():
+
+            for path in SessionWriter.repair(self.catalog.path(session_id)):
+
+                print(f"Arquivo de sessão interrompida recuperado: {path}")
+
+            self.catalog.register_session_files(session_id)
+            self.catalog.finish_session(session_id, SessionCatalog.INTERRUPTED)
+
+    def finish_session(self, status = SessionCatalog.FINISHED):
+
+        if not self.session_open:
+
+            return
+
+        self.session_open = False
+        self.catalog.register_session_files(self.session_id)
+        self.catalog.finish_session(self.session_id, status)
+        self.catalog.close()
+
+    def poll_events(self, phase_name, phase):
+
+        events = pygame.event.get()
+        bot = self.bots.get(phase_name)
+
+        if bot is not None:
+
+            events.extend(bot.events(phase))
+
+        return events
+
+    def tick(self):
+
+        self.frames += 1
+
+        if self.headless:
+
+            self.game_clock.advance(1 / Config.FPS)
+            self.clock.tick()
+
+        else:
+
+            self.clock.tick(Config.FPS)
+
+    def display_message_while_collecting(self, message, collector_function):
+
+        start_time = pygame.time.get_ticks()
+        collector_function()
+
+        if self.headless:
+
+            return
+
+        while True:
 
             self.screen.fill(Config.COLORS["WHITE"])
-            phase_two.display_dashboard(self.screen, self.font)
-            phase_two.draw_checkpoints_and_lines(self.screen, self.font)
-            phase_two.draw_user_line(self.screen)
+            text = self.font.render(message, True, Config.COLORS["BLACK"])
+            text_rect = text.get_rect(center = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2))
+            self.screen.blit(text, text_rect)
+
+            pygame.display.flip()
+
+            current_time = pygame.time.get_ticks()
+
+            if current_time - start_time > 1000:
+
+                break
 
             for event in pygame.event.get():
 
+                if event.type == pygame.QUIT:
+
+                    pygame.quit()
+
+    def final_display_message(self, message):
+
+        self.screen.fill(Config.COLORS["WHITE"])
+        text = self.font.render(message, True, Config.COLORS["BLACK"])
+        text_rect = text.get_rect(center = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2))
+        self.screen.blit(text, text_rect)
+
+        pygame.display.flip()
+
+        if not self.headless:
+
+            time.sleep(0.9)
+
+    def handle_profiler_key(self, event):
+
+        if self.profiler is not None and event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+
+            self.show_profiler = not self.show_profiler
+
+            if not self.show_profiler:
+
+                self.renderer.remove("profiler")
+
+    def draw_profiler_overlay(self):
+
+        if self.show_profiler and self.profiler.count("frame") % 15 == 0:
+
+            text = (f"Quadro p50: {self.profiler.percentile('frame', 50) * 1000:.1f} ms  "
+                    f"p99: {self.profiler.percentile('frame', 99) * 1000:.1f} ms")
+            self.renderer.text("profiler", text, (10, Config.SCREEN_HEIGHT - 40), Config.COLORS["BLUE"])
+
+    def present_frame(self):
+
+        profiler = self.profiler
+
+        if profiler is None:
+
+            self.renderer.present()
+
+            return
+
+        self.draw_profiler_overlay()
+        rects = self.renderer.compose()
+        profiler.lap("draw")
+        self.renderer.flip(rects)
+        profiler.lap("flip")
+        profiler.end_frame()
+
+    def save_profile(self):
+
+        if self.profiler is not None:
+
+            self.profiler.save(self.output_folder)
+
+    def draw_checkpoints(self, surface, phase_two):
+
+        pygame.draw.lines(surface, Config.COLORS["BLACK"], False, phase_two.checkpoints, 5)
+
+        for i, (point, status) in enumerate(zip(phase_two.checkpoints, phase_two.checkpoint_status)):
+
+            radius = phase_two.checkpoint_radius
+            surface.blit(self.renderer.checkpoint_sprite(i, status, radius), (point[0] - radius, point[1] - radius))
+
+    def run(self):
+
+        try:
+
+            self.play()
+
+        finally:
+
+            self.close()
+
+            pygame.quit()
+
+    def close(self):
+
+        self.data_collector_one.stop_collection()
+        self.data_collector_two.stop_collection()
+        SessionWriter.close_all()
+        self.finish_session(SessionCatalog.INTERRUPTED)
+
+    def play(self):
+
+        self.data_collector_one.record_to("phase_one_sensor_data", self.export_csv)
+        self.display_message_while_collecting("Fase 1: Iniciando...", self.data_collector_one.start_collection)
+        phase_one = PhaseOne(self.output_folder, self.profiler, self.game_clock)
+        phase_one.record_to("phase_one", self.export_csv)
+        phase_one_running = True
+        profiler = self.profiler
+
+        self.renderer.begin_scene()
+
+        while phase_one_running:
+
+            if profiler is not None:
+
+                profiler.start_frame()
+
+            for event in self.poll_events("phase_one", phase_one):
+
+                if event.type == pygame.QUIT:
+
+                    phase_one_running = False
+
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+
+                    phase_one.handle_click(event.pos)
+
+                else:
+
+                    self.handle_profiler_key(event)
+
+            if profiler is not None:
+
+                profiler.lap("events")
+
+            if phase_one.points >= phase_one.phase_goal:
+
+                phase_one_running = False
+
+            if profiler is not None:
+
+                profiler.lap("update")
+
+            for i, (text, position) in enumerate(phase_one.dashboard_lines()):
+
+                self.renderer.text(("dashboard", i), text, position)
+
+            x, y, radius = phase_one.target
+            self.renderer.place("target", self.renderer.target_sprite(radius), (x - radius, y - radius))
+
+            self.present_frame()
+            self.tick()
+
+        self.final_display_message("Fase 1: Concluída!")
+        self.data_collector_one.stop_collection()
+        phase_one.close_writer()
+        self.phase_one_complete = True
+
+        while not self.phase_one_complete:
+
+            time.sleep(0.1)
+
+        self.data_collector_two.record_to("phase_two_sensor_data", self.export_csv)
+        self.display_message_while_collecting("Fase 2: Iniciando...", self.data_collector_two.start_collection)
+        phase_two = PhaseTwo(self.output_folder, self.profiler, self.game_clock)
+        phase_two.record_to("phase_two", self.export_csv)
+        phase_two_running = True
+
+        self.renderer.begin_scene()
+        checkpoint_state = None
+
+        if profiler is not None:
+
+            profiler.reset_frames()
+
+        drawn_line = None
+        drawn_points = 0
+
+        while phase_two_running:
+
+            if profiler is not None:
+
+                profiler.start_frame()
+
+            motion = []
+
+            for event in self.poll_events("phase_two", phase_two):
+
                 if event.type == pygame.QUIT:
 
                     phase_two_running = False
+                    self.data_collector_two.stop_collection()
+                    phase_two.close_writer()
+                    self.save_profile()
+                    self.finish_session(SessionCatalog.INTERRUPTED)
 
                     return
 
+                if event.type == pygame.MOUSEMOTION:
+
+                    motion.append(event.pos)
+
+                    continue
+
+                phase_two.handle_motion(motion)
+                motion = []
+
                 phase_two.handle_event(event)
+                self.handle_profiler_key(event)
+
+            phase_two.handle_motion(motion)
+
+            if profiler is not None:
+
+                profiler.lap("events")
 
             if not phase_two.advance_level():
 
                 phase_two_running = False
 
-            pygame.display.flip()
-            self.clock.tick(Config.FPS)
+            if profiler is not None:
+
+                profiler.lap("update")
+
+            state = (tuple(phase_two.checkpoints), tuple(phase_two.checkpoint_status))
+
+            if state != checkpoint_state:
+
+                self.renderer.set_background(lambda surface: self.draw_checkpoints(surface, phase_two))
+                checkpoint_state = state
+
+            if phase_two.user_line is not drawn_line:
+
+                self.renderer.clear_stroke()
+                drawn_line, drawn_points = phase_two.user_line, 0
+
+            if len(drawn_line) > drawn_points:
+
+                self.renderer.draw_stroke(drawn_line[max(drawn_points - 1, 0):], Config.COLORS["BLUE"], 3)
+                drawn_points = len(drawn_line)
+
+            for i, (text, position) in enumerate(phase_two.dashboard_lines()):
+
+                self.renderer.text(("dashboard", i), text, position)
+
+            self.present_frame()
+            self.tick()
 
         self.final_display_message("Fase 2: Concluída!")
         self.data_collector_two.stop_collection()
+        phase_two.close_writer()
         self.phase_two_complete = True
 
-        phase_two.save_statistics_to_csv("phase_two.csv")
-        self.data_collector_two.save_sensor_data_to_csv("phase_two_sensor_data.csv")
+        self.save_profile()
+        self.finish_session()
 
         while not self.phase_two_complete:
 
             time.sleep(0.1)
 
-        pygame.quit()
+class Simulation:
+
+    def __init__(self, sessions = 1, seed = 0, output_folder = os.path.join("Results", "Simulacao"), sample_rate = 1000, profile = False,
+                 source_factory = None, protocol = "csv", export_csv = False, patient = "Simulação", bot_factories = None):
+
+        self.sessions = sessions
+        self.seed = seed
+        self.output_folder = output_folder
+        self.sample_rate = sample_rate
+        self.profile = profile
+        self.source_factory = source_factory
+        self.protocol = protocol
+        self.export_csv = export_csv
+        self.patient = patient
+        self.bot_factories = bot_factories
+
+    def run(self):
+
+        results = []
+
+        try:
+
+            for i in range(self.sessions):
+
+                seed = self.seed + i
+                random.seed(seed)
+
+                game = Game(profile = self.profile,
+                            headless = True,
+                            seed = seed,
+                            output_folder = self.output_folder,
+                            sample_rate = self.sample_rate,
+                            source_factory = self.source_factory,
+                            protocol = self.protocol,
+                            export_csv = self.export_csv,
+                            patient = f"{self.patient} {i + 1}",
+                            bot_factories = self.bot_factories)
+
+                start = time.perf_counter()
+
+                try:
+
+                    game.play()
+
+                finally:
+
+                    game.close()
+
+                results.append({"session": game.session_id,
+                                "seed": seed,
+                                "seconds": time.perf_counter() - start,
+                                "frames": game.frames,
+                                "samples": len(game.data_collector_one.buffer) + len(game.data_collector_two.buffer)})
+
+        finally:
+
+            pygame.quit()
+
+        total = sum(result["seconds"] for result in results)
+        frames = sum(result["frames"] for result in results)
+
+        print(f"{len(results)} sessões simuladas em {total:.2f} s "
+              f"({total / max(len(results), 1) * 1000:.1f} ms por sessão, {frames / max(total, 1e-9):.0f} quadros/s)")
+
+        return results
 
 if __name__ == "__main__":
 
-    Game().run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description = "Jogo de Precisão")
+    parser.add_argument("--profile", action = "store_true", help = "registra tempos de quadro e de coleta em profile.csv, na pasta da sessão (F3 mostra o resumo)")
+    parser.add_argument("--headless", action = "store_true", help = "simula sessões com jogadores automáticos, sem janela")
+    parser.add_argument("--sessions", type = int, default = 1, help = "número de sessões simuladas")
+    parser.add_argument("--seed", type = int, default = 0, help = "semente aleatória da simulação")
+    parser.add_argument("--output", default = os.path.join("Results", "Simulacao"), help = "pasta dos resultados simulados")
+    parser.add_argument("--sample-rate", type = int, default = 1000, help = "taxa de amostragem nominal dos sensores (Hz), usada pela coleta, pelo filtro do EMG e pelo sensor simulado")
+    parser.add_argument("--source", choices = ["serial", "virtual", "replay"], default = None, help = "origem das amostras dos sensores")
+    parser.add_argument("--port", help = "porta serial do dispositivo real (padrão: COM5); implica --source serial")
+    parser.add_argument("--replay", help = "arquivo *_sensor_data (.rqs ou .csv) reproduzido com --source replay")
+    parser.add_argument("--speed", type = float, default = 1.0, help = "velocidade da reprodução (0 = máxima)")
+    parser.add_argument("--protocol", choices = ["csv", "binary"], default = "csv", help = "protocolo serial do dispositivo")
+    parser.add_argument("--csv", action = "store_true", help = "exporta também uma cópia CSV de cada arquivo da sessão")
+    parser.add_argument("--patient", help = "nome do paciente registrado no catálogo de sessões")
+    parser.add_argument("--click-probability", type = float, default = 0.25, help = "chance de clique por quadro do jogador automático da fase 1")
+    parser.add_argument("--click-spread", type = float, default = 0.4, help = "dispersão dos cliques da fase 1, em raios do alvo")
+    parser.add_argument("--trace-speed", type = float, default = 12, help = "velocidade do traço do jogador automático da fase 2 (pixels por quadro)")
+    parser.add_argument("--trace-noise", type = float, default = 1.5, help = "desvio do traço da fase 2 (pixels)")
+    args = parser.parse_args()
+
+    if args.port is not None:
+
+        if args.source not in (None, "serial"):
+
+            parser.error("--port só pode ser usado com --source serial")
+
+        args.source = "serial"
+
+    if args.source == "serial":
+
+        source_factory = lambda: SerialSource(args.port or "COM5")
+
+    elif args.source == "virtual":
+
+        source_factory = lambda: VirtualSerialSource(args.sample_rate, args.seed, protocol = args.protocol)
+
+    elif args.source == "replay":
+
+        if not args.replay:
+
+            parser.error("--source replay exige --replay ARQUIVO")
+
+        source_factory = lambda: ReplaySource(args.replay, args.speed or None, protocol = args.protocol)
+
+    else:
+
+        source_factory = None
+
+    if args.headless:
+
+        bot_factories = {"phase_one": lambda rng: ClickBot(rng, args.click_probability, args.click_spread),
+                         "phase_two": lambda rng: TraceBot(rng, args.trace_speed, noise = args.trace_noise)}
+
+        Simulation(args.sessions, args.seed, args.output, args.sample_rate, args.profile, source_factory, args.protocol, args.csv,
+                   args.patient or "Simulação", bot_factories).run()
+
+    else:
+
+        Game(profile = args.profile, sample_rate = args.sample_rate, source_factory = source_factory, protocol = args.protocol,
+             export_csv = args.csv, patient = args.patient).run()
\ No newline at end of file
@@ -0,0 +1,235 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+def load_dashboard_module():
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Dashboard PBL.py")
+    spec = importlib.util.spec_from_file_location("dashboard_pbl", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["dashboard_pbl"] = module
+    spec.loader.exec_module(module)
+
+    return module
+
+dashboard = load_dashboard_module()
+
+class BatchReport:
+
+    VERSION = 2
+    CACHE = "relatorios.json"
+    SUMMARY = "resumo.csv"
+    SENSOR_SUFFIX = "_sensor_data"
+    EXTENSIONS = (dashboard.SessionFormat.EXTENSION, ".csv")
+
+    def __init__(self, folder = "Results", output = "Reports", workers = None, force = False):
+
+        self.folder = folder
+        self.output = output
+        self.workers = workers
+        self.force = force
+
+    @classmethod
+    def find_file(cls, folder, stem):
+
+        for extension in cls.EXTENSIONS:
+
+            path = os.path.join(folder, stem + extension)
+
+            if os.path.exists(path):
+
+                return path
+
+        return None
+
+    def patients(self):
+
+        if not os.path.exists(os.path.join(self.folder, dashboard.SessionCatalog.FILENAME)):
+
+            return {}
+
+        catalog = dashboard.SessionCatalog(self.folder)
+        patients = {session["id"]: session["patient"] for session in catalog.sessions()}
+        catalog.close()
+
+        return patients
+
+    def find_sessions(self):
+
+        output = os.path.abspath(self.output)
+        patients = self.patients()
+        jobs = []
+
+        for folder, folders, names in os.walk(self.folder):
+
+            folders[:] = sorted(name for name in folders if os.path.abspath(os.path.join(folder, name)) != output)
+            relative = os.path.relpath(folder, self.folder)
+            phases = sorted({os.path.splitext(name)[0][:-len(self.SENSOR_SUFFIX)] for name in names
+                             if os.path.splitext(name)[0].endswith(self.SENSOR_SUFFIX) and os.path.splitext(name)[1] in self.EXTENSIONS})
+
+            for phase in phases:
+
+                session = "" if relative == "." else relative.replace(os.sep, "/")
+                name = (session.replace("/", "_") + "_" if session else "") + phase + ".pdf"
+
+                jobs.append({"key": f"{session}/{phase}" if session else phase,
+                             "session": session,
+                             "phase": phase,
+                             "patient": patients.get(os.path.basename(folder), ""),
+                             "sensor": self.find_file(folder, phase + self.SENSOR_SUFFIX),
+                             "statistics": self.find_file(folder, phase),
+                             "report": os.path.join(self.output, name)})
+
+        return jobs
+
+    @classmethod
+    def content_hash(cls, paths, chunk_size = 1 << 20):
+
+        digest = hashlib.sha256(f"{cls.VERSION}".encode())
+
+        for path in paths:
+
+            if path is None:
+
+                continue
+
+            digest.update(os.path.basename(path).encode("utf-8") + b"\0")
+
+            with open(path, mode = "rb") as file:
+
+                for chunk in iter(lambda: file.read(chunk_size), b""):
+
+                    digest.update(chunk)
+
+        return digest.hexdigest()
+
+    @classmethod
+    def process(cls, job, previous = None):
+
+        content = cls.content_hash([job["sensor"], job["statistics"]])
+
+        if previous is not None and previous["hash"] == content and os.path.exists(job["report"]):
+
+            return dict(previous, cached = True)
+
+        loader = dashboard.SensorLoader(job["sensor"], sort_columns = ())
+        loader.run()
+
+        if loader.error is not None:
+
+            raise loader.error
+
+        statistics = None if job["statistics"] is None else dashboard.SessionFormat.load(job["statistics"]).to_dataframe()
+        kpis = {name: loader.kpis.stats(position) for name, position in dashboard.Dashboard.CHANNELS.items()}
+        figures = dashboard.Dashboard.session_figures(loader.pyramids, statistics, features = loader.features)
+        title = " - ".join(part for part in ("Relatório da Sessão", job["patient"], job["key"]) if part)
+
+        dashboard.ReportWriter(job["report"], figures, kpis, statistics, title).write()
+
+        times = loader.data.column(0)
+        summary = {"sessão": job["session"],
+                   "paciente": job["patient"],
+                   "fase": job["phase"],
+                   "amostras": len(loader.data),
+                   "duração (s)": float(times[-1] - times[0]) if len(times) else 0.0}
+
+        for name, stats in kpis.items():
+
+            for key, label in (("mean", "média"), ("std", "desvio"), ("min", "mín."), ("max", "máx.")):
+
+                summary[f"{name} {label}"] = None if stats is None else float(stats[key])
+
+        emg = None if loader.features is None else dashboard.EmgFeatures.summary(loader.features.records)
+
+        for key, label in (("rms", "EMG RMS"), ("mav", "EMG MAV"), ("median_frequency", "EMG freq. mediana (Hz)"),
+                           ("median_frequency_slope", "EMG variação da freq. mediana (Hz/min)")):
+
+            summary[label] = None if emg is None else emg[key]
+
+        summary["interações"] = None if statistics is None else len(statistics)
+        summary["precisão média (%)"] = None if statistics is None or not len(statistics) else float(statistics.iloc[:, -1].mean())
+
+        return {"hash": content, "report": job["report"], "summary": summary, "cached": False}
+
+    def load_cache(self):
+
+        path = os.path.join(self.output, self.CACHE)
+
+        if self.force or not os.path.exists(path):
+
+            return {}
+
+        with open(path, mode = "r", encoding = "utf-8") as file:
+
+            return json.load(file)
+
+    def save_cache(self, results):
+
+        path = os.path.join(self.output, self.CACHE)
+
+        with open(path + ".partial", mode = "w", encoding = "utf-8") as file:
+
+            json.dump({key: {name: value for name, value in result.items() if name != "cached"} for key, result in results.items()},
+                      file, ensure_ascii = False, indent = 1)
+
+        os.replace(path + ".partial", path)
+
+    def run(self):
+
+        start = time.perf_counter()
+        os.makedirs(self.output, exist_ok = True)
+        cache = self.load_cache()
+        jobs = self.find_sessions()
+        results = {}
+        failures = 0
+
+        print(f"{len(jobs)} sessões encontradas em {self.folder}")
+
+        with ProcessPoolExecutor(max_workers = self.workers) as pool:
+
+            futures = {pool.submit(self.process, job, cache.get(job["key"])): job for job in jobs}
+
+            for future in as_completed(futures):
+
+                job = futures[future]
+
+                try:
+
+                    results[job["key"]] = future.result()
+
+                except Exception as e:
+
+                    failures += 1
+                    print(f"  {job['key']}: erro ({e})")
+
+                    continue
+
+                print(f"  {job['key']}: {'inalterada' if results[job['key']]['cached'] else 'relatório gerado'}")
+
+        self.save_cache(results)
+
+        summary = dashboard.pd.DataFrame([results[key]["summary"] for key in sorted(results)])
+        summary.to_csv(os.path.join(self.output, self.SUMMARY), index = False, encoding = "utf-8")
+
+        generated = sum(not result["cached"] for result in results.values())
+
+        print(f"{generated} relatórios gerados, {len(results) - generated} inalterados, {failures} com erro "
+              f"em {time.perf_counter() - start:.1f} s")
+
+        return results
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = "Gera relatórios em PDF e uma tabela-resumo para uma pasta de sessões")
+    parser.add_argument("folder", nargs = "?", default = "Results", help = "pasta com as sessões (.rqs ou .csv)")
+    parser.add_argument("--output", default = "Reports", help = "pasta dos relatórios, do resumo e do cache")
+    parser.add_argument("--workers", type = int, default = None, help = "número de processos (padrão: núcleos disponíveis)")
+    parser.add_argument("--force", action = "store_true", help = "ignora o cache e refaz todos os relatórios")
+    args = parser.parse_args()
+
+    BatchReport(args.folder, args.output, args.workers, args.force).run()
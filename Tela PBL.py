@@ -5,7 +5,14 @@ from PIL import Image, ImageTk
 
 def start_game():
 
-    subprocess.run(["python", "Jogo PBL.py"])
+    command = ["python", "Jogo PBL.py"]
+    patient = patient_name.get().strip()
+
+    if patient:
+
+        command += ["--patient", patient]
+
+    subprocess.run(command)
 
 def open_dashboard():
 
@@ -13,7 +20,7 @@ def open_dashboard():
 
 window = tk.Tk()
 window.title("RehabQuest")
-window.geometry("250x350")
+window.geometry("250x420")
 window.resizable(False, False)
 window.configure(bg = "#2B2B2B")
 
@@ -33,6 +40,13 @@ except Exception as e:
 
     print(f"Erro ao carregar a imagem: {e}")
 
+patient_name = tk.StringVar()
+
+ttk.Label(border_frame, text = "Paciente:", style = "Border.TLabel").pack()
+
+patient_entry = ttk.Entry(border_frame, textvariable = patient_name)
+patient_entry.pack(pady = 5)
+
 start_button = ttk.Button(border_frame,
                           text = "Jogar",
                           command = start_game,
@@ -48,5 +62,6 @@ dashboard_button.pack(pady = 10)
 style = ttk.Style()
 style.configure("TButton", font = ("Helvetica Neue", 12), padding = 6)
 style.configure("Border.TFrame", background = "#444444")
+style.configure("Border.TLabel", background = "#444444", foreground = "#FFFFFF")
 
 window.mainloop()
\ No newline at end of file
@@ -0,0 +1,208 @@
+import os
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import welch
+from session_format import SessionFormat, SessionData
+
+class EmgFeatures:
+
+    VERSION = 1
+    SUFFIX = ".features"
+    COLUMNS = [{"name": "Tempo (s)", "format": "<f8"},
+               {"name": "RMS", "format": "<f4"},
+               {"name": "MAV", "format": "<f4"},
+               {"name": "Cruzamentos por Zero", "format": "<i4"},
+               {"name": "Frequência Mediana (Hz)", "format": "<f4"},
+               {"name": "Frequência Média (Hz)", "format": "<f4"}]
+
+    def __init__(self, fs = 1000, window = 0.25, step = 0.125, segment = 256, batch_samples = 1 << 20):
+
+        self.fs = fs
+        self.window = max(int(round(window * fs)), 4)
+        self.step = max(int(round(step * fs)), 1)
+        self.segment = min(segment, self.window)
+        self.batch = max(batch_samples // self.window, 1)
+
+    def parameters(self):
+
+        return {"version": self.VERSION, "fs": self.fs, "window": self.window, "step": self.step, "segment": self.segment}
+
+    def count(self, length):
+
+        return (length - self.window) // self.step + 1 if length >= self.window else 0
+
+    def window_features(self, windows):
+
+        centered = windows - windows.mean(axis = 1, keepdims = True)
+        signs = np.signbit(centered)
+        frequencies, power = welch(centered, fs = self.fs, nperseg = self.segment, axis = -1)
+        cumulative = np.cumsum(power, axis = 1)
+        total = cumulative[:, -1]
+
+        with np.errstate(invalid = "ignore", divide = "ignore"):
+
+            median = np.where(total > 0, frequencies[np.argmax(cumulative >= total[:, None] / 2, axis = 1)], np.nan)
+            mean = np.where(total > 0, power @ frequencies / total, np.nan)
+
+        return (np.sqrt(np.mean(np.square(centered), axis = 1)),
+                np.mean(np.abs(centered), axis = 1),
+                np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis = 1),
+                median,
+                mean)
+
+    def compute(self, values, times = None):
+
+        count = self.count(len(values))
+        records = np.empty(count, dtype = SessionFormat.dtype(self.COLUMNS))
+        starts = np.arange(count) * self.step
+
+        if times is None:
+
+            records[self.COLUMNS[0]["name"]] = (starts + self.window / 2) / self.fs
+
+        elif count:
+
+            records[self.COLUMNS[0]["name"]] = np.asarray(times[starts + self.window // 2])
+
+        for first in range(0, count, self.batch):
+
+            last = min(first + self.batch, count)
+            segment = np.asarray(values[first * self.step:(last - 1) * self.step + self.window], dtype = np.float64)
+            windows = sliding_window_view(segment, self.window)[::self.step]
+
+            for column, feature in zip(self.COLUMNS[1:], self.window_features(windows)):
+
+                records[column["name"]][first:last] = feature
+
+        return records
+
+    @classmethod
+    def cache_path(cls, path):
+
+        return path + cls.SUFFIX
+
+    def cached(self, path, times, values):
+
+        cache_path = self.cache_path(path)
+        attrs = dict(self.parameters(), source_size = os.path.getsize(path), source_mtime = os.path.getmtime(path))
+
+        if os.path.exists(cache_path):
+
+            try:
+
+                data = SessionFormat.read(cache_path)
+
+                if data.attrs == attrs:
+
+                    return data
+
+            except (OSError, ValueError):
+
+                pass
+
+        records = self.compute(values, times)
+
+        try:
+
+            SessionFormat.write(cache_path, self.COLUMNS, records, attrs)
+
+        except OSError:
+
+            pass
+
+        return SessionData({"version": 1, "columns": self.COLUMNS, "attrs": attrs}, records)
+
+    @classmethod
+    def summary(cls, records):
+
+        if not len(records):
+
+            return None
+
+        times = np.asarray(records[cls.COLUMNS[0]["name"]], dtype = np.float64)
+        median = np.asarray(records[cls.COLUMNS[4]["name"]], dtype = np.float64)
+        finite = np.isfinite(median)
+        slope = np.polyfit(times[finite], median[finite], 1)[0] * 60 if np.count_nonzero(finite) > 1 else 0.0
+
+        return {"rms": float(np.sqrt(np.mean(np.square(records[cls.COLUMNS[1]["name"]], dtype = np.float64)))),
+                "mav": float(np.mean(records[cls.COLUMNS[2]["name"]], dtype = np.float64)),
+                "zero_crossings": float(np.mean(records[cls.COLUMNS[3]["name"]], dtype = np.float64)),
+                "median_frequency": float(np.mean(median[finite])) if finite.any() else float("nan"),
+                "mean_frequency": float(np.nanmean(records[cls.COLUMNS[5]["name"]])) if finite.any() else float("nan"),
+                "median_frequency_slope": float(slope)}
+
+    @classmethod
+    def window(cls, records, start_time, end_time):
+
+        times = records[cls.COLUMNS[0]["name"]]
+        first = int(np.searchsorted(times, start_time, side = "left"))
+        last = int(np.searchsorted(times, end_time, side = "right"))
+
+        return records[first:last]
+
+class StreamingEmgFeatures:
+
+    def __init__(self, fs = 1000, window = 0.25, step = 0.125, history = 4096):
+
+        self.window_seconds = window
+        self.step_seconds = step
+        self.features = EmgFeatures(fs, window, step)
+        self.history = np.empty(history, dtype = SessionFormat.dtype(EmgFeatures.COLUMNS))
+        self.count = 0
+        self.reset()
+
+    @property
+    def fs(self):
+
+        return self.features.fs
+
+    def reset(self):
+
+        self.pending = np.empty(0)
+        self.elapsed = 0.0
+        self.latest = None
+
+    def retune(self, fs, tolerance = 0.02):
+
+        if abs(fs - self.fs) <= tolerance * self.fs:
+
+            return False
+
+        self.elapsed += len(self.pending) / self.fs
+        self.pending = np.empty(0)
+        self.features = EmgFeatures(round(fs, 1), self.window_seconds, self.step_seconds)
+
+        return True
+
+    def update(self, chunk):
+
+        self.pending = np.concatenate((self.pending, np.asarray(chunk, dtype = np.float64)))
+        records = self.features.compute(self.pending)
+
+        if not len(records):
+
+            return records
+
+        consumed = len(records) * self.features.step
+        records[EmgFeatures.COLUMNS[0]["name"]] += self.elapsed
+        self.pending = self.pending[consumed:]
+        self.elapsed += consumed / self.fs
+        self.latest = records[-1]
+
+        size = len(self.history)
+        kept = records[-size:]
+        slots = (self.count + np.arange(len(records) - len(kept), len(records))) % size
+        self.history[slots] = kept
+        self.count += len(records)
+
+        return records
+
+    def recent(self):
+
+        size = len(self.history)
+
+        if self.count <= size:
+
+            return self.history[:self.count]
+
+        return np.roll(self.history, -(self.count % size))
@@ -0,0 +1,272 @@
+import os
+import re
+import time
+import sqlite3
+import numpy as np
+from session_format import SessionFormat
+from emg_features import EmgFeatures
+
+class SessionCatalog:
+
+    FILENAME = "catalog.sqlite"
+    RUNNING = "em andamento"
+    FINISHED = "concluída"
+    INTERRUPTED = "interrompida"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            id TEXT PRIMARY KEY,
+            patient TEXT NOT NULL,
+            started REAL NOT NULL,
+            finished REAL,
+            status TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS files (
+            session_id TEXT NOT NULL REFERENCES sessions(id),
+            name TEXT NOT NULL,
+            phase TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            rows INTEGER NOT NULL,
+            duration REAL NOT NULL,
+            sample_rate REAL,
+            modified REAL NOT NULL,
+            PRIMARY KEY (session_id, name));
+        CREATE TABLE IF NOT EXISTS stats (
+            session_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            column TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            mean REAL,
+            std REAL,
+            min REAL,
+            max REAL,
+            PRIMARY KEY (session_id, name, column));
+        CREATE TABLE IF NOT EXISTS emg (
+            session_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            rms REAL,
+            mav REAL,
+            median_frequency REAL,
+            median_frequency_slope REAL,
+            PRIMARY KEY (session_id, name));
+        CREATE INDEX IF NOT EXISTS sessions_by_patient ON sessions (patient, started);
+    """
+
+    def __init__(self, root = "Results"):
+
+        self.root = root
+
+        os.makedirs(root, exist_ok = True)
+
+        self.connection = sqlite3.connect(os.path.join(root, self.FILENAME))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(self.SCHEMA)
+
+    def close(self):
+
+        self.connection.close()
+
+    def path(self, session_id, name = ""):
+
+        return os.path.join(self.root, session_id, name)
+
+    @staticmethod
+    def slug(patient):
+
+        return re.sub(r"[^\w-]+", "_", patient).strip("_") or "paciente"
+
+    def create_session(self, patient = None, started = None):
+
+        patient = patient or "Paciente"
+        started = time.time() if started is None else started
+        base = time.strftime("%Y%m%d_%H%M%S", time.localtime(started)) + "_" + self.slug(patient)
+        session_id = base
+        suffix = 1
+
+        while os.path.exists(self.path(session_id)):
+
+            suffix += 1
+            session_id = f"{base}_{suffix}"
+
+        os.makedirs(self.path(session_id))
+
+        with self.connection:
+
+            self.connection.execute("INSERT INTO sessions (id, patient, started, status) VALUES (?, ?, ?, ?)",
+                                    (session_id, patient, started, self.RUNNING))
+
+        return session_id
+
+    def finish_session(self, session_id, status = FINISHED):
+
+        with self.connection:
+
+            self.connection.execute("UPDATE sessions SET finished = ?, status = ? WHERE id = ?", (time.time(), status, session_id))
+
+    @staticmethod
+    def summarize(data):
+
+        stats = []
+
+        for position, name in enumerate(data.columns):
+
+            column = np.asarray(data[name], dtype = np.float64)
+            finite = column[np.isfinite(column)]
+
+            if len(finite):
+
+                std = float(finite.std(ddof = 1)) if len(finite) > 1 else 0.0
+                stats.append((name, position, len(finite), float(finite.mean()), std, float(finite.min()), float(finite.max())))
+
+            else:
+
+                stats.append((name, position, 0, None, None, None, None))
+
+        return stats
+
+    @staticmethod
+    def summarize_emg(path, data):
+
+        times = data.column(0)
+
+        if len(data.columns) < 2 or len(data) < 2 or times[-1] <= times[0]:
+
+            return (None, None, None, None)
+
+        summary = EmgFeatures.summary(EmgFeatures(data.attrs["sample_rate"]).cached(path, times, data.column(1)).records)
+
+        if summary is None:
+
+            return (None, None, None, None)
+
+        return (summary["rms"], summary["mav"], summary["median_frequency"], summary["median_frequency_slope"])
+
+    def register_file(self, session_id, name, phase):
+
+        path = self.path(session_id, name)
+
+        if not os.path.exists(path):
+
+            return False
+
+        data = SessionFormat.read(path)
+        kind = "sensor" if "sample_rate" in data.attrs else "statistics"
+
+        if not len(data):
+
+            duration = 0.0
+
+        elif kind == "sensor":
+
+            duration = float(data.column(0)[-1] - data.column(0)[0])
+
+        else:
+
+            duration = float(np.sum(data.column(1), dtype = np.float64))
+
+        with self.connection:
+
+            self.connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                    (session_id, name, phase, kind, len(data), duration, data.attrs.get("sample_rate"), os.path.getmtime(path)))
+            self.connection.execute("DELETE FROM stats WHERE session_id = ? AND name = ?", (session_id, name))
+            self.connection.executemany("INSERT INTO stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                        [(session_id, name) + row for row in self.summarize(data)])
+            self.connection.execute("DELETE FROM emg WHERE session_id = ? AND name = ?", (session_id, name))
+
+            if kind == "sensor":
+
+                self.connection.execute("INSERT INTO emg VALUES (?, ?, ?, ?, ?, ?)", (session_id, name) + self.summarize_emg(path, data))
+
+        return True
+
+    def register_session_files(self, session_id):
+
+        for name in sorted(os.listdir(self.path(session_id))):
+
+            if name.endswith(SessionFormat.EXTENSION):
+
+                self.register_file(session_id, name, name[:-len(SessionFormat.EXTENSION)].replace("_sensor_data", ""))
+
+    def refresh(self, patient = None):
+
+        query = ("SELECT f.session_id, f.name, CASE WHEN f.kind = 'sensor' AND e.name IS NULL THEN NULL ELSE f.modified END AS modified "
+                 "FROM files f LEFT JOIN emg e ON e.session_id = f.session_id AND e.name = f.name")
+        known = {(row["session_id"], row["name"]): row["modified"] for row in self.connection.execute(query)}
+        updated = 0
+
+        for session in self.sessions(patient):
+
+            if session["status"] == self.RUNNING or not os.path.isdir(self.path(session["id"])):
+
+                continue
+
+            for name in os.listdir(self.path(session["id"])):
+
+                if name.endswith(SessionFormat.EXTENSION) and known.get((session["id"], name)) != os.path.getmtime(self.path(session["id"], name)):
+
+                    self.register_file(session["id"], name, name[:-len(SessionFormat.EXTENSION)].replace("_sensor_data", ""))
+                    updated += 1
+
+        return updated
+
+    def progress(self, patient, phase):
+
+        rows = self.connection.execute("SELECT s.id, s.started, f.kind, st.position, st.count, st.mean, st.std, e.rms, "
+                                       "(SELECT MAX(position) FROM stats WHERE session_id = st.session_id AND name = st.name) AS last "
+                                       "FROM sessions s JOIN files f ON f.session_id = s.id "
+                                       "JOIN stats st ON st.session_id = f.session_id AND st.name = f.name "
+                                       "LEFT JOIN emg e ON e.session_id = f.session_id AND e.name = f.name "
+                                       "WHERE s.patient = ? AND f.phase = ? ORDER BY s.started", (patient, phase))
+        sessions = {}
+
+        for row in rows:
+
+            session = sessions.setdefault(row["id"], {"id": row["id"], "started": row["started"], "precision": None, "time": None, "emg_rms": None})
+
+            if row["mean"] is None:
+
+                continue
+
+            if row["kind"] == "statistics" and row["position"] == row["last"]:
+
+                session["precision"] = row["mean"]
+
+            elif row["kind"] == "statistics" and row["position"] == 1:
+
+                session["time"] = row["mean"]
+
+            elif row["kind"] == "sensor" and row["position"] == 1:
+
+                session["emg_rms"] = row["rms"] if row["rms"] is not None else float(row["std"] * np.sqrt((row["count"] - 1) / row["count"]))
+
+        return list(sessions.values())
+
+    def unfinished_sessions(self):
+
+        return [row["id"] for row in self.connection.execute("SELECT id FROM sessions WHERE status = ?", (self.RUNNING,))]
+
+    def sessions(self, patient = None):
+
+        query = ("SELECT s.*, COALESCE(SUM(CASE WHEN f.kind = 'statistics' THEN f.duration END), 0) AS duration, "
+                 "COUNT(f.name) AS files FROM sessions s LEFT JOIN files f ON f.session_id = s.id")
+        parameters = ()
+
+        if patient:
+
+            query += " WHERE s.patient = ?"
+            parameters = (patient,)
+
+        return self.connection.execute(query + " GROUP BY s.id ORDER BY s.started DESC", parameters).fetchall()
+
+    def patients(self):
+
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT patient FROM sessions ORDER BY patient")]
+
+    def files(self, session_id):
+
+        return self.connection.execute("SELECT * FROM files WHERE session_id = ? ORDER BY name", (session_id,)).fetchall()
+
+    def file_stats(self, session_id, name):
+
+        return self.connection.execute("SELECT * FROM stats WHERE session_id = ? AND name = ? ORDER BY position",
+                                       (session_id, name)).fetchall()
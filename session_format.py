@@ -0,0 +1,207 @@
+import os
+import csv
+import json
+import argparse
+import struct
+import numpy as np
+
+class SessionData:
+
+    def __init__(self, header, records):
+
+        self.header = header
+        self.records = records
+        self.columns = [column["name"] for column in header["columns"]]
+        self.attrs = header.get("attrs", {})
+        self.rates = {column["name"]: column["rate"] for column in header["columns"] if "rate" in column}
+        self.derived = {}
+
+    def __len__(self):
+
+        return len(self.records)
+
+    def __getitem__(self, name):
+
+        if name not in self.rates:
+
+            return self.records[name]
+
+        if name not in self.derived:
+
+            self.derived[name] = self.records[name] / float(self.attrs[self.rates[name]])
+
+        return self.derived[name]
+
+    def column(self, index):
+
+        return self[self.columns[index]]
+
+    def to_dataframe(self):
+
+        import pandas as pd
+
+        return pd.DataFrame({name: self[name] for name in self.columns}, columns = self.columns)
+
+class SessionFormat:
+
+    MAGIC = b"RQSESS01"
+    EXTENSION = ".rqs"
+    ALIGNMENT = 64
+    HEADER_RESERVE = 1024
+
+    @staticmethod
+    def dtype(columns):
+
+        return np.dtype([(column["name"], column["format"]) for column in columns])
+
+    @classmethod
+    def header_bytes(cls, columns, attrs = None, size = None):
+
+        header = json.dumps({"version": 1, "columns": columns, "attrs": attrs or {}}, ensure_ascii = False).encode("utf-8")
+        prefix = len(cls.MAGIC) + 4
+        size = size or max(cls.HEADER_RESERVE, -(-(prefix + len(header)) // cls.ALIGNMENT) * cls.ALIGNMENT)
+
+        if prefix + len(header) > size:
+
+            return None
+
+        return cls.MAGIC + struct.pack("<I", size - prefix) + header.ljust(size - prefix)
+
+    @classmethod
+    def read_header(cls, file):
+
+        prefix = file.read(len(cls.MAGIC) + 4)
+
+        if len(prefix) < len(cls.MAGIC) + 4 or prefix[:len(cls.MAGIC)] != cls.MAGIC:
+
+            raise ValueError("Arquivo de sessão inválido")
+
+        length, = struct.unpack("<I", prefix[len(cls.MAGIC):])
+        content = file.read(length)
+
+        if len(content) < length:
+
+            raise ValueError("Arquivo de sessão inválido")
+
+        header = json.loads(content.decode("utf-8"))
+        header["offset"] = len(cls.MAGIC) + 4 + length
+
+        return header
+
+    @classmethod
+    def open(cls, path, columns, attrs = None):
+
+        file = open(path, mode = "w+b")
+        file.write(cls.header_bytes(columns, attrs))
+        file.flush()
+        os.fsync(file.fileno())
+
+        return file
+
+    @classmethod
+    def update_attrs(cls, file, columns, attrs):
+
+        position = file.tell()
+        file.seek(len(cls.MAGIC))
+        length, = struct.unpack("<I", file.read(4))
+        header = cls.header_bytes(columns, attrs, len(cls.MAGIC) + 4 + length)
+
+        if header is not None:
+
+            file.seek(0)
+            file.write(header)
+
+        file.seek(position)
+
+        return header is not None
+
+    @classmethod
+    def write(cls, path, columns, records, attrs = None):
+
+        with cls.open(path, columns, attrs) as file:
+
+            file.write(np.ascontiguousarray(records, dtype = cls.dtype(columns)).tobytes())
+
+    @classmethod
+    def read(cls, path, mmap = True):
+
+        with open(path, mode = "rb") as file:
+
+            header = cls.read_header(file)
+
+        dtype = cls.dtype(header["columns"])
+        count = (os.path.getsize(path) - header["offset"]) // dtype.itemsize
+
+        if mmap and count:
+
+            records = np.memmap(path, dtype = dtype, mode = "r", offset = header["offset"], shape = (count,))
+
+        else:
+
+            records = np.fromfile(path, dtype = dtype, count = count, offset = header["offset"])
+
+        return SessionData(header, records)
+
+    @classmethod
+    def repair(cls, path):
+
+        with open(path, mode = "rb+") as file:
+
+            header = cls.read_header(file)
+            itemsize = cls.dtype(header["columns"]).itemsize
+            size = os.path.getsize(path)
+            file.truncate(size - (size - header["offset"]) % itemsize)
+
+    @staticmethod
+    def read_csv(path):
+
+        import pandas as pd
+
+        frame = pd.read_csv(path, encoding = "ISO-8859-1")
+        columns = [{"name": name, "format": frame[name].dtype.str} for name in frame.columns]
+        records = np.empty(len(frame), dtype = SessionFormat.dtype(columns))
+
+        for name in frame.columns:
+
+            records[name] = frame[name].to_numpy()
+
+        return SessionData({"version": 1, "columns": columns, "attrs": {}}, records)
+
+    @classmethod
+    def load(cls, path):
+
+        if path.lower().endswith(cls.EXTENSION):
+
+            return cls.read(path)
+
+        return cls.read_csv(path)
+
+    @classmethod
+    def to_csv(cls, path, csv_path = None, encoding = "utf-8", chunk_size = 65536):
+
+        data = cls.read(path)
+        csv_path = csv_path or os.path.splitext(path)[0] + ".csv"
+        formats = [column.get("csv", "{}") for column in data.header["columns"]]
+
+        with open(csv_path, mode = "w", newline = "", encoding = encoding) as file:
+
+            writer = csv.writer(file)
+            writer.writerow(data.columns)
+
+            for start in range(0, len(data), chunk_size):
+
+                columns = [data[name][start:start + chunk_size].tolist() for name in data.columns]
+                writer.writerows([[fmt.format(value) for fmt, value in zip(formats, row)] for row in zip(*columns)])
+
+        return csv_path
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = "Converte arquivos de sessão do RehabQuest para CSV")
+    parser.add_argument("arquivos", nargs = "+")
+    parser.add_argument("--encoding", default = "utf-8")
+    args = parser.parse_args()
+
+    for path in args.arquivos:
+
+        print(SessionFormat.to_csv(path, encoding = args.encoding))
\ No newline at end of file